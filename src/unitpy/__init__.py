@@ -1,5 +1,3 @@
-import pkg_resources
-
 from unitpy.config import CONFIG
 import unitpy.errors as errors
 from unitpy.definitions.ledger import ledger
@@ -11,5 +9,17 @@ Q = Quantity
 
 __all__ = ("Unit", "Quantity", "U", "Q")
 
-# single-sourcing the package version
-__version__ = pkg_resources.require("unitpy")[0].version
+
+def __getattr__(name: str):
+    # single-sourcing the package version; looked up on first access as it is slow to import
+    if name == "__version__":
+        from importlib.metadata import version
+        globals()["__version__"] = version("unitpy")
+        return globals()["__version__"]
+    if name == "QuantityArray":
+        # needs numpy, which is optional
+        from unitpy.quantity_array import QuantityArray
+        globals()["QuantityArray"] = QuantityArray
+        return QuantityArray
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -61,13 +61,22 @@ class Config:
         self.abbr = False  # false is full word
         self.multiplication_seperator = " "  #  " " or " * "
         self.division_seperator = "/"
+        self.simplify_units = False  # products/quotients of quantities in the preferred unit ('kg*m**2/s**2' -> 'joule')
+        self.parse_cache_size = 1024  # number of parsed unit strings to keep; 0 disables the cache
+        self.converter_cache_size = 256  # number of 'Unit.converter' objects to keep; 0 disables the cache
+        self.conversion_cache_size = 1024  # number of unit pairs to keep conversion factors for; 0 disables
+        self.lazy_prefixes = False  # resolve prefixed units (e.g. 'kPa') on first use instead of at import
+        self.ledger_cache = True  # load the unit ledger from a snapshot in the user cache directory
+        self.cache_dir = None  # None is the platform user cache directory (e.g. ~/.cache/unitpy)
 
         if env_flag:
             self.get_config_from_env()
 
     def get_config_from_env(self):
         variables = self.__dict__
-        config_ = {k.strip('unitpy_'): convert_string_to_types(v) for k, v in dotenv_values().items()}
+        prefix = "unitpy_"
+        config_ = {k[len(prefix):] if k.startswith(prefix) else k: convert_string_to_types(v)
+                   for k, v in dotenv_values().items()}
         for k, v in config_.items():
             if k in variables:
                 if k == "format_symbols":
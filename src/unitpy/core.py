@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import itertools
 import math
 import copy
+import struct
 import typing
+import weakref
+from collections import deque
 from datetime import timedelta
 
 from unitpy.errors import UnitDimensionError
@@ -11,9 +13,20 @@ from unitpy.config import CONFIG
 from unitpy.definitions.dimensions import Dimension
 from unitpy.definitions.unit_base import BaseSet
 from unitpy.definitions.entry import Entry
-from unitpy.definitions.ledger import ledger
+from unitpy.definitions.ledger import ledger, get_entry_by_label
+from unitpy.utils.cache import LRUCache
 from unitpy.utils.equation_formating import equation_formater
 
+converter_cache = LRUCache("converter_cache_size")
+conversion_cache = LRUCache("conversion_cache_size")
+decode_cache = LRUCache("parse_cache_size")  # encoded units (see 'Unit.to_bytes')
+
+# encoded unit: ledger version, number of entries (uint32, like the entry ids), then per entry the id and an int8
+# exponent; exponents that don't fit in an int8 are marked with -128 and follow as a double
+_header_struct = struct.Struct("<II")
+_entry_struct = struct.Struct("<Ib")
+_float_struct = struct.Struct("<d")
+
 
 def get_base_unit(unit: dict[Entry, int | float]) -> BaseSet:
     base = BaseSet()
@@ -22,17 +35,137 @@ def get_base_unit(unit: dict[Entry, int | float]) -> BaseSet:
     return base
 
 
+def normalize_unit(unit: dict[Entry, int | float]) -> dict[Entry, int | float]:
+    """
+    Canonical form of a unit: entries with a zero exponent are dropped ('m/m' --> {}) and the rest are sorted by label,
+    so 'm*s' and 's*m' are the same unit (and key). Always a new dict.
+    """
+    if len(unit) == 1:
+        return {k: v for k, v in unit.items() if v != 0}
+    return {k: v for k, v in sorted(unit.items(), key=_label_of_item) if v != 0}
+
+
+def _label_of_item(item: tuple[Entry, int | float]) -> str:
+    return item[0].label
+
+
+def get_multiplier(unit: dict[Entry, int | float]) -> int | float:
+    return math.prod([k.multiplier ** v for k, v in unit.items()])
+
+
+def get_offset(unit: dict[Entry, int | float]) -> int | float:
+    entries = [(k, v) for k, v in unit.items() if v != 0]
+    if len(entries) == 1 and entries[0][1] == 1:
+        return entries[0][0].offset
+    return 0
+
+
+class CompiledUnit(typing.NamedTuple):
+    """
+    Flat form of a unit expression with the derived values precomputed; see 'unitpy.utils.parsing.compile_unit'.
+    """
+    entries: tuple[tuple[Entry, int | float], ...]
+    multiplier: int | float
+    offset: int | float
+    signature: tuple[int | float, ...]
+
+    @classmethod
+    def from_dict(cls, unit: dict[Entry, int | float]) -> CompiledUnit:
+        unit = normalize_unit(unit)
+        return cls(tuple(unit.items()), get_multiplier(unit), get_offset(unit), get_base_unit(unit).dimension_signature)
+
+
+def get_unit_from_labels(key: tuple[tuple[str | Entry, int | float], ...]) -> Unit:
+    """ Used to unpickle `Unit` objects; key is ((entry or entry label, exponent), ...). """
+    return Unit._new({get_entry_by_label(k) if isinstance(k, str) else k: v for k, v in key})
+
+
+def encode_unit(unit: dict[Entry, int | float]) -> bytes:
+    parts = [_header_struct.pack(ledger.version, len(unit))]
+    for k, v in unit.items():
+        if isinstance(v, int) and -128 < v < 128:
+            parts.append(_entry_struct.pack(ledger.get_entry_id(k), v))
+        else:
+            parts.append(_entry_struct.pack(ledger.get_entry_id(k), -128))
+            parts.append(_float_struct.pack(v))
+    return b"".join(parts)
+
+
+def decode_unit(data: bytes) -> dict[Entry, int | float]:
+    try:
+        version, length = _header_struct.unpack_from(data)
+        if version != ledger.version:
+            raise ValueError(f"Unit was encoded with a different ledger (version {version}, not {ledger.version}).")
+
+        unit = dict()
+        pos = _header_struct.size
+        for _ in range(length):
+            id_, v = _entry_struct.unpack_from(data, pos)
+            pos += _entry_struct.size
+            if v == -128:
+                v, = _float_struct.unpack_from(data, pos)
+                pos += _float_struct.size
+            unit[ledger.get_entry_by_id(id_)] = v
+    except struct.error as e:
+        raise ValueError(f"Invalid encoded unit: {data!r}") from e
+
+    if pos != len(data):
+        raise ValueError(f"Invalid encoded unit: {data!r}")
+    return unit
+
+
+preferred_units: dict[tuple[int | float, ...], Unit] = dict()  # built on first use; see 'get_preferred_units'
+# named SI units that compound units simplify to; units only meaningful for one quantity (gray, sievert, katal, lux,
+# becquerel, hertz) are left out, so e.g. a squared velocity isn't shown as an absorbed dose
+preferred_labels = ("newton", "joule", "watt", "pascal", "coulomb", "volt", "ohm", "siemens", "farad", "weber",
+                    "tesla", "henry")
+
+
+def get_preferred_units() -> dict[tuple[int | float, ...], Unit]:
+    """
+    Dimension signature -> unit that compound units simplify to: the 'preferred_unit' hints of the ledger classes,
+    then the units in 'preferred_labels' (e.g. 'joule' for 'kg*m**2/s**2').
+    """
+    if not preferred_units:
+        for dimension, class_ in ledger.classes.items():
+            if isinstance(dimension, Dimension) and isinstance(class_, dict) and "preferred_unit" in class_ \
+                    and not dimension.dimensionless:  # not 'radian' for ratios
+                preferred_units.setdefault(dimension.dimension_signature, Unit(class_["preferred_unit"]))
+        for label in preferred_labels:
+            entry = ledger.get_entry_by_label(label)
+            preferred_units.setdefault(entry.base_unit.dimension_signature, Unit._new({entry: 1}))
+
+    return preferred_units
+
+
 def get_unit_from_base(base_set: BaseSet) -> dict[Entry, int | float]:
     dict_ = dict()
 
-    for base in base_set.__slots__:
-        value = getattr(base_set, base)
+    for base, value in zip(base_set.base_labels, base_set.exponents):
         if value != 0:
             dict_[ledger.get_entry(base)] = value
 
     return dict_
 
 
+def get_conversion_factors(src: Unit, dst: Unit) -> tuple[int | float, int | float]:
+    """
+    Returns (scale, offset) with 'value in dst = value in src * scale + offset'.
+    Cached per pair of unit expressions (bounded by 'CONFIG.conversion_cache_size').
+    """
+    key = (src._key, dst._key)
+    factors = conversion_cache.get(key)
+    if factors is None:
+        if src != dst:
+            raise UnitDimensionError(f"Units are not compatible.\n{src} --> {dst}")
+
+        # dst.from_base_value(src.to_base_value(value)) == value * scale + offset
+        factors = (src.multiplier / dst.multiplier, src.multiplier * src.offset / dst.multiplier - dst.offset)
+        conversion_cache[key] = factors
+
+    return factors
+
+
 class MetaUnit(type):
     def __getattr__(self, item):
         return Unit(item)
@@ -41,10 +174,28 @@ class MetaUnit(type):
 np = None
 
 
+def get_numpy():
+    """ numpy is optional; imported on first use. """
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
 class Unit(metaclass=MetaUnit):
+    """
+    Units are immutable and interned: equal unit expressions (same entries and exponents, in any order) are the same
+    object.
+    """
     _ledger = ledger
+    # canonical keys, and the keys of the dicts the units were made from (so those skip 'normalize_unit')
+    _interned: weakref.WeakValueDictionary[tuple[tuple[Entry, int | float], ...], Unit] = \
+        weakref.WeakValueDictionary()
+    # strong references to the latest units, so units of intermediate results in chained expressions aren't rebuilt
+    _recent: deque[Unit] = deque(maxlen=256)
 
-    __slots__ = ("_unit", "_base_unit", "_multiplier", "_offset")
+    __slots__ = ("_unit", "_base_unit", "_multiplier", "_offset", "_key", "_bytes", "__weakref__")
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         if method != "__call__":
@@ -73,18 +224,63 @@ class Unit(metaclass=MetaUnit):
             a = parse_unit(unit)
             return a
         elif isinstance(unit, BaseSet):
-            return Unit(get_unit_from_base(unit))
+            return Unit._new(get_unit_from_base(unit))
 
-        return super().__new__(cls)
+        return Unit._new(unit if unit is not None else dict())
 
-    def __init__(self, unit: str | dict[Entry, int | float] | BaseSet = None):
-        if hasattr(self, "_unit"):
-            return
+    @classmethod
+    def _new(cls, unit: dict[Entry, int | float]) -> Unit:
+        """ Interned unit for 'unit' (in canonical form, see 'normalize_unit'); the dict is not changed. """
+        raw_key = tuple(unit.items())
+        self = cls._interned.get(raw_key)
+        if self is not None:
+            return self
 
-        self._unit: dict[Entry, int | float] | None = unit if unit is not None else dict()
+        unit = normalize_unit(unit)
+        key = tuple(unit.items())
+        self = cls._interned.get(key)
+        if self is None:
+            self = cls._intern(unit, key)
+        if raw_key != key:
+            cls._interned[raw_key] = self
+
+        return self
+
+    @classmethod
+    def _intern(cls, unit: dict[Entry, int | float], key: tuple[tuple[Entry, int | float], ...]) -> Unit:
+        """ New unit registered under 'key'; 'unit' must be in canonical form and not interned yet. """
+        self = super().__new__(cls)
+        self._unit: dict[Entry, int | float] = unit
         self._base_unit: BaseSet | None = None
         self._multiplier: int | float | None = None
         self._offset: int | float | None = None
+        self._key: tuple[tuple[Entry, int | float], ...] = key
+        self._bytes: tuple[int, bytes] | None = None  # (ledger version, encoding)
+        cls._interned[key] = self
+        cls._recent.append(self)
+        return self
+
+    @classmethod
+    def _from_compiled(cls, compiled: CompiledUnit) -> Unit:
+        """
+        Interned unit for a compiled unit expression; the entries are already canonical, so a new unit is one dict
+        construction and the precomputed values are reused.
+        """
+        self = cls._interned.get(compiled.entries)
+        if self is None:
+            self = cls._intern(dict(compiled.entries), compiled.entries)
+            self._multiplier = compiled.multiplier
+            self._offset = compiled.offset
+            self._base_unit = BaseSet.from_exponents(compiled.signature)
+
+        return self
+
+    def __init__(self, unit: str | dict[Entry, int | float] | BaseSet = None):
+        pass  # everything is done in __new__ so interned units are not re-initialized
+
+    def __reduce__(self):
+        # rebuild through the interning instead of copying the slots; entries pickle by label when in the ledger
+        return get_unit_from_labels, (tuple(self._unit.items()),)
 
     def __str__(self):
         if CONFIG.abbr:
@@ -95,22 +291,65 @@ class Unit(metaclass=MetaUnit):
         return self.__str__()
 
     def __hash__(self) -> int:
-        return self._base_unit.__hash__()
+        return self.base_unit.__hash__()
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact encoding of the unit: the ledger version and (entry id, exponent) pairs. Only processes with the same
+        ledger version can decode it (see 'Unit.from_bytes').
+        """
+        version = ledger.version
+        if self._bytes is None or self._bytes[0] != version:
+            self._bytes = version, encode_unit(self._unit)  # re-encoded when the ledger changes (ids and version)
+        return self._bytes[1]
+
+    def simplify(self) -> Unit:
+        """
+        Compound unit of base dimensions as the preferred unit of its dimension ('kg*m**2/s**2' --> 'joule'); see
+        'get_preferred_units'. Returned as is: single entries, units with a dimensionless entry ('rad/s' is not
+        'hertz') or a derived unit ('N*m' may be a torque), units with a dimension in more than one entry
+        ('km/(m*s)') and units without a preferred unit.
+        """
+        if len(self._unit) < 2:
+            return self
+
+        dimensions = set()
+        for entry in self._unit:
+            signature = entry.base_unit.dimension_signature
+            dimension = [i for i, v in enumerate(signature) if v != 0]
+            if len(dimension) != 1 or dimension[0] in dimensions:
+                return self
+            dimensions.add(dimension[0])
+
+        return get_preferred_units().get(self.dimension_signature, self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Unit:
+        """ Unit from 'Unit.to_bytes' (bytes, bytearray or memoryview); decoded units are cached. """
+        data = bytes(data)  # hashable
+        result = decode_cache.get(data)
+        if result is None:
+            result = cls._new(decode_unit(data))
+            decode_cache[data] = result
+        return result
+
+    @property
+    def key(self) -> tuple[tuple[Entry, int | float], ...]:
+        """ Canonical key of the unit expression ('m' and 'km' have different keys, but are '=='). """
+        return self._key
 
     def __copy__(self) -> Unit:
-        unit = Unit()
-        unit._unit = copy.copy(self._unit)
-        return unit
+        return self  # immutable
 
     def __deepcopy__(self, memo) -> Unit:
-        unit = Unit()
-        unit._unit = copy.deepcopy(self._unit)
-        return unit
+        return self  # immutable; also keeps the entries the ones in the ledger
 
     def __eq__(self, other: Unit) -> bool:
         """
         This matches to 'base units'; not 'units'
         """
+        if self is other:
+            return True
         if not isinstance(other, Unit):
             raise UnitDimensionError(f"'Unit' equality can only be done between 'Unit' objects. \n{self} == {other}")
 
@@ -134,12 +373,12 @@ class Unit(metaclass=MetaUnit):
 
     def __mul__(self, other: int | float | Unit) -> Unit | Quantity:
         if isinstance(other, Unit):
-            unit = Unit()
-            for k in set(itertools.chain(self._unit.keys(), other._unit.keys())):
-                unit._unit[k] = self._unit.get(k, 0) + other._unit.get(k, 0)
-            return unit
+            unit = dict(self._unit)
+            for k, v in other._unit.items():
+                unit[k] = unit.get(k, 0) + v
+            return Unit._new(unit)
         elif isinstance(other, int) or isinstance(other, float):
-            return Quantity(other, self)
+            return Quantity._from_value(other, self)
         else:
             global np
             if np is None:
@@ -156,57 +395,46 @@ class Unit(metaclass=MetaUnit):
         raise UnitDimensionError(f"Can only multiply Unit by Unit.\n{self} * {other}")
 
     def __imul__(self, other: Unit) -> Unit:
+        # units are shared (parse cache), so in-place operations return a new unit
         if not isinstance(other, Unit):
             raise UnitDimensionError(f"Can only multiply Unit by Unit.\n{self} * {other}")
 
-        for k in set(itertools.chain(self._unit.keys(), other._unit.keys())):
-            self._unit[k] = self._unit.get(k, 0) + other._unit.get(k, 0)
-        return self
+        return self.__mul__(other)
 
     __rmul__ = __mul__
 
     def __truediv__(self, other: int | float | Unit) -> Unit | Quantity:
         if isinstance(other, Unit):
-            unit = Unit()
-            for k in set(itertools.chain(self._unit.keys(), other._unit.keys())):
-                unit._unit[k] = self._unit.get(k, 0) - other._unit.get(k, 0)
-            return unit
+            unit = dict(self._unit)
+            for k, v in other._unit.items():
+                unit[k] = unit.get(k, 0) - v
+            return Unit._new(unit)
         elif isinstance(other, int) or isinstance(other, float):
-            return Quantity(1 / other, self)
+            return Quantity._from_value(1 / other, self)
         raise UnitDimensionError(f"Can only divide 'Unit' by 'Unit'.\n{self} / {other}")
 
     def __itruediv__(self, other: Unit) -> Unit:
         if not isinstance(other, Unit):
             raise UnitDimensionError(f"Can only divide 'Unit' by 'Unit'.\n{self} / {other}")
 
-        for k in set(itertools.chain(self._unit.keys(), other._unit.keys())):
-            self._unit[k] = self._unit.get(k, 0) - other._unit.get(k, 0)
-        return self
+        return self.__truediv__(other)
 
     def __rtruediv__(self, other: int | float | Unit) -> Unit | Quantity:
         if isinstance(other, Unit):
-            unit = Unit()
-            for k in set(itertools.chain(self._unit.keys(), other._unit.keys())):
-                unit._unit[k] = other._unit.get(k, 0) - self._unit.get(k, 0)
-            return unit
+            return other.__truediv__(self)
         elif isinstance(other, int) or isinstance(other, float):
-            return Quantity(other, self ** -1)
+            return Quantity._from_value(other, self ** -1)
         raise UnitDimensionError(f"Can only divide 'Unit' by 'Unit'.\n{self} + {other}")
 
     def __pow__(self, power: int | float) -> Unit:
         if isinstance(power, int) or isinstance(power, float):
-            unit = Unit()
-            for k in self._unit:
-                unit._unit[k] = self._unit[k] * power
-            return unit
+            return Unit._new({k: v * power for k, v in self._unit.items()})
 
         raise TypeError(f"Power must be a 'int' or 'float'.\n{self} + {power}")
 
     def __ipow__(self, power: int | float) -> Unit:
         if isinstance(power, int) or isinstance(power, float):
-            for k in self._unit:
-                self._unit[k] = self._unit[k] * power
-            return self
+            return self.__pow__(power)
 
         raise TypeError(f"Power must be a 'int' or 'float'.\n{self} + {power}")
 
@@ -221,23 +449,18 @@ class Unit(metaclass=MetaUnit):
     @property
     def multiplier(self) -> int | float:
         if self._multiplier is None:
-            try:
-                self._multiplier = math.prod([k.multiplier ** v for k, v in self._unit.items()])
-            except AttributeError:
-                # math.prod added in python 3.8
-                # will be removed when support for python 3.7 is over
-                multipliers = [k.multiplier ** v for k, v in self._unit.items()]
-                prod = 1
-                for multi in multipliers:
-                    prod *= multi
-                self._multiplier = prod
+            self._multiplier = get_multiplier(self._unit)
 
         return self._multiplier
 
     @property
     def offset(self) -> int | float:
+        """
+        Offset of an affine unit (e.g. 'degC'). Only a lone affine entry with exponent 1 has an offset; in compound
+        units ('degC/min', 'J/degF', 'degC**2') it is a temperature difference, so the offset is 0.
+        """
         if self._offset is None:
-            self._offset = sum([k.offset for k, v in self._unit.items()])
+            self._offset = get_offset(self._unit)
 
         return self._offset
 
@@ -260,24 +483,120 @@ class Unit(metaclass=MetaUnit):
 
         return self._base_unit
 
-    def to_base_value(self, value: int | float) -> int | float:
-        return self.multiplier * (value + self.offset)
+    @property
+    def dimension_signature(self) -> tuple[int | float, ...]:
+        """ Hashable dimension of the unit ('m' and 'km' have the same signature). """
+        if self._base_unit is None:
+            self._base_unit = get_base_unit(self._unit)
+
+        return self._base_unit._exponents
 
-    def from_base_value(self, value: int | float) -> int | float:
-        value = value / self.multiplier - self.offset
-        return value
+    def is_compatible(self, other: Unit | str) -> bool:
+        """ True if values can be converted between the units (same dimension). """
+        if self is other:
+            return True
+        if isinstance(other, str):
+            other = Unit(other)
+        elif not isinstance(other, Unit):
+            return False
+
+        return self.dimension_signature == other.dimension_signature
+
+    def to_base_value(self, value: int | float, out=None) -> int | float:
+        """
+        Value in this unit to base units. Works element-wise on numpy arrays; 'out' is an optional float array the
+        result is written to in place (it may be 'value' itself).
+        """
+        multiplier = self.multiplier
+        offset = self.offset
+        if out is None:
+            # single expressions so numpy can reuse the temporary array
+            if offset != 0:
+                return multiplier * (value + offset) if multiplier != 1 else value + offset
+            return multiplier * value if multiplier != 1 else value
+
+        numpy = get_numpy()
+        if offset != 0:
+            numpy.add(value, offset, out=out)
+            numpy.multiply(out, multiplier, out=out)
+        else:
+            numpy.multiply(value, multiplier, out=out)
+        return out
+
+    def from_base_value(self, value: int | float, out=None) -> int | float:
+        """ Value in base units to this unit; see 'to_base_value'. """
+        multiplier = self.multiplier
+        offset = self.offset
+        if out is None:
+            if multiplier != 1:
+                return value / multiplier - offset if offset != 0 else value / multiplier
+            return value - offset if offset != 0 else value
+
+        numpy = get_numpy()
+        numpy.divide(value, multiplier, out=out)
+        if offset != 0:
+            numpy.subtract(out, offset, out=out)
+        return out
+
+    @staticmethod
+    def converter(src: str | Unit, dst: str | Unit) -> Converter:
+        """ Reusable converter of values from unit 'src' to unit 'dst' (cached per pair of unit objects). """
+        if isinstance(src, str):
+            src = Unit(src)
+        if isinstance(dst, str):
+            dst = Unit(dst)
+
+        # keyed on identity as units compare equal by base unit ('m' == 'km');
+        # the cached converter keeps both units alive, so the ids can't be reused while it is cached
+        key = (id(src), id(dst))
+        converter = converter_cache.get(key)
+        if converter is None:
+            converter = Converter(src, dst)
+            converter_cache[key] = converter
+
+        return converter
+
+
+class Converter:
+    """ Converts values from unit 'src' to unit 'dst' with a precomputed scale and offset. """
+    __slots__ = ("src", "dst", "scale", "offset")
+
+    def __init__(self, src: Unit, dst: Unit):
+        self.src = src
+        self.dst = dst
+        self.scale, self.offset = get_conversion_factors(src, dst)
+
+    def __str__(self):
+        return f"Converter({self.src} --> {self.dst})"
+
+    __repr__ = __str__
+
+    def __call__(self, value: int | float | list | tuple | np.ndarray, out: np.ndarray = None) \
+            -> int | float | list | tuple | np.ndarray:
+        """ 'out' is an optional float array the result is written to in place (it may be 'value' itself). """
+        if isinstance(value, list):
+            return [v * self.scale + self.offset for v in value]
+        if isinstance(value, tuple):
+            return tuple(v * self.scale + self.offset for v in value)
+        if out is not None:
+            numpy = get_numpy()
+            numpy.multiply(value, self.scale, out=out)
+            if self.offset != 0:
+                numpy.add(out, self.offset, out=out)
+            return out
+        if self.offset == 0:
+            return value * self.scale
+        return value * self.scale + self.offset
 
 
 ## Quantity ## noqa
 #######################################################################################################################
 #######################################################################################################################
 np_wrap = None
+_time_signature = BaseSet(second=1).dimension_signature
 
 
-class Quantity(typing.SupportsRound):
-    compact_pickle = True
-    # full pickle 624 bytes -> compact pickle 98 bytes
-    # full 0.20 -> compact 0.31 create time
+class Quantity:
     _ledger = ledger
 
     __slots__ = ("_unit", "_base_value")
@@ -289,25 +608,42 @@ class Quantity(typing.SupportsRound):
             np_wrap = numpy_wrap
 
     def __array_function__(self, func, types, args, kwargs):
-        self.load_numpy()
+        if np_wrap is None:
+            self.load_numpy()
         return np_wrap("function", func, args, kwargs, types)
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
-        self.load_numpy()
-        types = set(
-            type(arg)
-            for arg in list(inputs) + list(kwargs.values())
-            if hasattr(arg, "__array_ufunc__")
-        )
-        return np_wrap("ufunc", ufunc, inputs, kwargs, types)
+        if np_wrap is None:
+            self.load_numpy()
+        return np_wrap("ufunc", ufunc, inputs, kwargs, None)  # 'types' is unused by the ufunc dispatch
 
     def __new__(cls, value: str | int | float = None, unit: Unit | BaseSet | str = None):
         if isinstance(value, str):
             from unitpy.utils.parsing import parse_quantity
             return parse_quantity(value)
+        if cls is Quantity and not isinstance(value, (int, float)) and \
+                (isinstance(value, (list, tuple)) or getattr(value, "ndim", 0)):
+            from unitpy.quantity_array import QuantityArray  # sequences become arrays (needs numpy)
+            return super().__new__(QuantityArray)
 
         return super().__new__(cls)
 
+    @classmethod
+    def _from_base(cls, base_value, unit: Unit) -> Quantity:
+        """ Internal constructor; 'base_value' is already in base units and 'unit' is a resolved Unit. """
+        if cls is Quantity and not isinstance(base_value, (int, float)) and getattr(base_value, "ndim", 0):
+            from unitpy.quantity_array import QuantityArray
+            cls = QuantityArray
+        self = object.__new__(cls)
+        self._base_value = base_value
+        self._unit = unit
+        return self
+
+    @classmethod
+    def _from_value(cls, value, unit: Unit) -> Quantity:
+        """ Internal constructor; 'value' is in 'unit', which is a resolved Unit. """
+        return cls._from_base(unit.to_base_value(value), unit)
+
     def __init__(self, value: str | int | float, unit: Unit | BaseSet | str = None):
         if hasattr(self, "_unit"):
             return
@@ -332,12 +668,12 @@ class Quantity(typing.SupportsRound):
         else:
             return hash((self._base_value, self._unit))
 
-    def __getstate__(self):
-        if self.compact_pickle:
-            return str(self)
-        return self._base_value, self._unit.abbr
+    def __reduce_ex__(self, protocol):
+        # base value as is (no formatting or parsing); numpy arrays use out-of-band buffers with protocol 5
+        return get_quantity_from_base, (self._base_value, self._unit)
 
     def __setstate__(self, state):
+        # pickles written before '__reduce_ex__': "<value> <unit>" or (base value, unit abbr)
         if isinstance(state, str):
             from unitpy.utils.parsing import parse_quantity
             qant = parse_quantity(state)
@@ -345,16 +681,16 @@ class Quantity(typing.SupportsRound):
             self._unit = qant._unit
         else:
             self._base_value = state[0]
-            self._unit = state[1]
+            self._unit = state[1] if isinstance(state[1], Unit) else Unit(state[1])
 
     def __copy__(self) -> Quantity:
-        return self.__class__(copy.copy(self._base_value), copy.copy(self._unit))
+        return self._from_base(copy.copy(self._base_value), self._unit)
 
     def __deepcopy__(self, memo) -> Quantity:
-        return self.__class__(copy.deepcopy(self._base_value), copy.deepcopy(self._unit))
+        return self._from_base(copy.deepcopy(self._base_value), self._unit)
 
     def _comparison_check(self, other: Quantity):
-        if not isinstance(other, Quantity) or self.base_unit != other.base_unit:
+        if not isinstance(other, Quantity) or not self._unit.is_compatible(other._unit):
             raise UnitDimensionError("'Quantity' comparison can only happen between quantities with same units."
                                      f"\n{self} <--> {other}")
 
@@ -378,11 +714,12 @@ class Quantity(typing.SupportsRound):
         self._comparison_check(other)
         return self.base_value >= other.base_value
 
+    def _is_compatible(self, other) -> bool:
+        return isinstance(other, Quantity) and self._unit.is_compatible(other._unit)
+
     def __add__(self, other: Quantity) -> Quantity:
-        if isinstance(other, Quantity) and self.unit == other.unit:
-            base_value = self.base_value + other.base_value
-            quant = Quantity(base_value, self.base_unit)
-            return quant.to(self.unit)
+        if self._is_compatible(other):
+            return Quantity._from_base(self._base_value + other._base_value, self._unit)
         if other == 0:
             return self
         raise UnitDimensionError(f"Cannot add quantities with different units.\n{self} + {other}")
@@ -406,27 +743,26 @@ class Quantity(typing.SupportsRound):
         raise UnitDimensionError(f"Cannot subtract quantities with different units.\n{self} - {other}")
 
     def __sub__(self, other: Quantity) -> Quantity:
-        if isinstance(other, Quantity) and self.unit == other.unit:
-            base_value = self.base_value - other.base_value
-            quant = Quantity(base_value, self.base_unit)
-            return quant.to(self.unit)
+        if self._is_compatible(other):
+            return Quantity._from_base(self._base_value - other._base_value, self._unit)
         if isinstance(other, int) and other == 0:
             return self
         raise UnitDimensionError(f"Cannot subtract quantities with different units.\n{self} - {other}")
 
     def __rsub__(self, other: Quantity) -> Quantity:
-        if isinstance(other, Quantity) and self.unit == other.unit:
-            base_value = other.base_value - self.base_value
-            quant = Quantity(base_value, self.base_unit)
-            return quant.to(self.unit)
+        if self._is_compatible(other):
+            return Quantity._from_base(other._base_value - self._base_value, self._unit)
         else:
             raise UnitDimensionError(f"Cannot subtract quantities with different units.\n{self} + {other}")
 
     def __mul__(self, other: int | float | Quantity) -> Quantity:
+        # products are done on the values (not base values) so e.g. 2.2 mph * 1 km/h shows as 2.2, not 2.1999...
         if isinstance(other, (int, float)):
-            return Quantity(self._value * other, self.unit)
+            return Quantity._from_value(self._value * other, self._unit)
         elif isinstance(other, Quantity):
-            return Quantity(self._value * other._value, self.unit * other.unit)
+            unit = self._unit * other._unit
+            result = Quantity._from_value(self._value * other._value, unit)
+            return result.simplify() if CONFIG.simplify_units else result
         else:
             raise UnitDimensionError(f"Can only multiply Quantity by scalar.\n{self} * {other}\n"
                                      f"This error can is commonly caused by missing parenthesis.")
@@ -434,10 +770,9 @@ class Quantity(typing.SupportsRound):
     def __imul__(self, other: int | float | Quantity) -> Quantity:
         if isinstance(other, (int, float)):
             self._base_value *= other
-            self._base_value = self._base_value
             return self
         elif isinstance(other, Quantity):
-            self._base_value *= other._value
+            self._base_value *= other._base_value
             self._unit *= other.unit
             return self
         else:
@@ -447,9 +782,11 @@ class Quantity(typing.SupportsRound):
 
     def __truediv__(self, other: int | float | Quantity) -> Quantity:
         if isinstance(other, (int, float)):
-            return Quantity(self._value / other, self.unit)
+            return Quantity._from_value(self._value / other, self._unit)
         elif isinstance(other, Quantity):
-            return Quantity(self._value / other._value, self.unit / other.unit)
+            unit = self._unit / other._unit
+            result = Quantity._from_value(self._value / other._value, unit)
+            return result.simplify() if CONFIG.simplify_units else result
         else:
             raise UnitDimensionError(f"Can only divide 'Quantity' by 'int', 'float' or 'Quantity'.\n{self} / {other}")
 
@@ -466,17 +803,20 @@ class Quantity(typing.SupportsRound):
 
     def __rtruediv__(self, other: int | float | Quantity) -> Quantity:
         if isinstance(other, (int, float)):
-            return Quantity(other / self._value, Unit("") / self.unit)
+            unit = Unit() / self._unit
+            result = Quantity._from_value(other / self._value, unit)
         elif isinstance(other, Quantity):
-            return Quantity(other._value / self._value, Unit("") / self.unit)
+            result = Quantity._from_value(other._value / self._value, other._unit / self._unit)
         else:
             raise UnitDimensionError(f"Can only divide 'Quantity' by 'int', 'float' or 'Quantity'.\n{self} / {other}")
 
+        return result.simplify() if CONFIG.simplify_units else result
+
     def __floordiv__(self, other: int | float | Quantity) -> Quantity:
         if isinstance(other, (int, float)):
-            return Quantity(self._value // other, self.unit)
+            return Quantity._from_value(self._value // other, self._unit)
         elif isinstance(other, Quantity):
-            return Quantity(self._value // other._value, self.unit / other.unit)
+            return Quantity._from_value(self._value // other._value, self._unit / other._unit)
         else:
             raise UnitDimensionError(f"Can only divide 'Quantity' by 'int', 'float' or 'Quantity'.\n{self} / {other}")
 
@@ -493,7 +833,9 @@ class Quantity(typing.SupportsRound):
 
     def __pow__(self, power: int | float) -> Quantity:
         if isinstance(power, int) or isinstance(power, float):
-            return Quantity(self._value ** power, self.unit ** power)
+            unit = self._unit ** power
+            result = Quantity._from_value(self._value ** power, unit)
+            return result.simplify() if CONFIG.simplify_units else result
         else:
             raise UnitDimensionError(f"Power must be a 'int' or 'float'.\n{self} ** {power}")
 
@@ -506,17 +848,17 @@ class Quantity(typing.SupportsRound):
             raise UnitDimensionError(f"Power must be a 'int' or 'float'.\n{self} ** {power}")
 
     def __int__(self) -> Quantity:
-        return Quantity(int(self._value), self.unit)
+        return Quantity._from_value(int(self._value), self._unit)
 
     def __float__(self) -> Quantity:
-        return Quantity(float(self._value), self.unit)
+        return Quantity._from_value(float(self._value), self._unit)
 
     def __floor__(self) -> Quantity:
-        return Quantity(math.floor(self._value), self.unit)
+        return Quantity._from_value(math.floor(self._value), self._unit)
 
     def __mod__(self, other: int | float) -> Quantity:
         if isinstance(other, (int, float)):
-            return Quantity(self._value % other, self.unit)
+            return Quantity._from_value(self._value % other, self._unit)
         else:
             raise UnitDimensionError("Can only perform the modulo operation of a 'Quantity' with an 'int' or 'float'."
                                      f"\n{self} % {other}")
@@ -530,13 +872,13 @@ class Quantity(typing.SupportsRound):
                                      f"\n{self} % {other}")
 
     def __abs__(self) -> Quantity:
-        return Quantity(abs(self._value), self.unit)
+        return Quantity._from_value(abs(self._value), self._unit)
 
     def __ceil__(self) -> Quantity:
-        return Quantity(math.ceil(self._value), self.unit)
+        return Quantity._from_value(math.ceil(self._value), self._unit)
 
     def __round__(self, n: int = 0) -> Quantity:
-        return Quantity(round(self._value, n), self.unit)
+        return Quantity._from_value(round(self._value, n), self._unit)
 
     @property
     def _value(self):
@@ -596,10 +938,11 @@ class Quantity(typing.SupportsRound):
         if isinstance(unit, str):
             unit = Unit(unit)
 
-        if self.unit != unit:
+        if not self._unit.is_compatible(unit):
             raise UnitDimensionError(f"Units are not compatible.\n{self} --> {unit}")
 
-        return Quantity(unit.from_base_value(self._base_value), unit)
+        # the base value doesn't depend on the unit
+        return Quantity._from_base(self._base_value, unit)
 
     def is_close(self, other: Quantity, rel_tol: int | float = 1e-9, abs_tol: Quantity = None) -> bool:
         """ Return True if the other quantity is close to this quantity and False otherwise. """
@@ -630,8 +973,20 @@ class Quantity(typing.SupportsRound):
     def sub_rel(self, other: Quantity) -> Quantity:
         return self.sub_relative(other)
 
+    def simplify(self) -> Quantity:
+        """ Quantity in the preferred unit of its dimension ('kg*m**2/s**2' --> 'joule'); see 'Unit.simplify'. """
+        unit = self._unit.simplify()
+        if unit is self._unit:
+            return self
+        return self.to(unit)
+
     def to_timedelta(self) -> timedelta:
-        if self.unit.dimensionality != Dimension(time=1):
+        if self._unit.dimension_signature != _time_signature:
             raise UnitDimensionError(f"Must be a time dimension to convert to 'timedelta'.\n{self}")
 
         return timedelta(seconds=self.to("s").v)
+
+
+def get_quantity_from_base(base_value, unit: Unit) -> Quantity:
+    """ Used to unpickle `Quantity` objects (arrays unpickle as `QuantityArray`). """
+    return Quantity._from_base(base_value, unit)
@@ -82,6 +82,11 @@ class Dimension:
     def abbr(self) -> str:
         return equation_formater({f"[{k.abbr}]": v for k, v in self.as_dict().items()})
 
+    @property
+    def dimension_signature(self) -> tuple[int | float, ...]:
+        """ Same as 'BaseSet.dimension_signature' (the base units are in the same order as the dimensions). """
+        return tuple(getattr(self, dim) for dim in self.__slots__)
+
     @property
     def dimensionless(self) -> bool:
         for dim in self.__slots__:
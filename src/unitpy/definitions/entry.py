@@ -35,6 +35,16 @@ class Entry:
     def __repr__(self):
         return f"Entry({self.label}, {self.abbr}, {self.prefix}, {self.base_unit})"
 
+    def __reduce__(self):
+        # units use the entries as keys, so unpickle to the ledger's entry rather than a copy
+        from unitpy.definitions.ledger import ledger, get_entry_by_label
+        if ledger.get_entry_by_label(self.label) is self:
+            return get_entry_by_label, (self.label,)
+
+        # not in the ledger (e.g. a custom entry), so a copy
+        return Entry, (self.label, self.abbr, self.base_unit, self._multiplier, self.offset, self.prefix,
+                       self.additional_labels)
+
     @property
     def multiplier(self) -> int | float:
         if self.prefix:
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import itertools
+import marshal
+import os
+import pathlib
+import sys
+import zlib
 
+from unitpy.config import CONFIG
 from unitpy.errors import AmbiguousUnitSymbolError
 from unitpy.definitions.constants import constants
 import unitpy.definitions.dimensions as dim_
@@ -9,9 +15,8 @@ import unitpy.definitions.prefix as prefix_
 from unitpy.definitions.entry import Entry
 
 import unitpy.definitions.unit_base as bases
-import unitpy.definitions.unit_derived as unit_derived
-import unitpy.definitions.unit_NIST as unit_NIST
-import unitpy.definitions.unit_extra as unit_extra
+
+SNAPSHOT_FORMAT = 1  # bump when the snapshot layout changes
 
 
 class DuplicateEntry:
@@ -31,11 +36,24 @@ class Ledger:
     constants = constants
     bases = bases.bases
     classes = dim_.classes
+    _prefix_list = tuple(prefixes.values())  # entry ids of lazy prefixed entries use this order
 
-    def __init__(self):
+    def __init__(self, lazy_prefixes: bool | None = None):
+        self.lazy_prefixes = CONFIG.lazy_prefixes if lazy_prefixes is None else lazy_prefixes
         self.units: list[Entry] = list()
         self._duplicate_symbols: dict[str, DuplicateEntry] = dict()
         self._lookup: dict[str, Entry] = dict()
+        self._symbols: frozenset[str] | None = None  # rebuilt on first access after the ledger changes
+        self._labels: dict[str, Entry] | None = None  # entries by label; rebuilt on first access after a change
+        self._ids: dict[Entry, int] | None = None  # entry ids (see `get_entry_id`); rebuilt after a change
+        self._version: int | None = None
+        self._dimension_index: dict[tuple[int | float, ...], tuple[Entry, ...]] | None = None
+
+        # lazy prefixes: symbols of unprefixed entries that take a prefix, and the prefixed entries resolved so far
+        self._prefixable: dict[str, list[tuple[Entry, str]]] = dict()
+        self._prefixed: dict[tuple[str, int], Entry] = dict()
+        self._prefixed_lookup: dict[str, Entry] = dict()
+        self._unprefixed: dict[Entry, tuple[prefix_.Prefix, Entry]] = dict()  # prefixed entry -> (prefix, entry)
 
     def __str__(self):
         return f"Ledger(units: {len(self.units)}, symbols: {len(self.symbols)})"
@@ -43,15 +61,25 @@ class Ledger:
     __repr__ = __str__
 
     def __contains__(self, item: str):
-        return item in self.symbols
+        if item in self._lookup:
+            return True
+        if self.lazy_prefixes:
+            try:
+                return self._get_prefixed_entry(item) is not None
+            except AmbiguousUnitSymbolError:
+                return False
+        return False
 
     @property
-    def symbols(self) -> set[str]:
-        return set(self._lookup.keys())
+    def symbols(self) -> frozenset[str]:
+        if self._symbols is None:
+            self._symbols = frozenset(self._lookup)
+        return self._symbols
 
     def get_entry(self, unit: str) -> Entry | None:
-        if unit in self._lookup:
-            return self._lookup[unit]
+        entry = self._lookup.get(unit)
+        if entry is not None:
+            return entry
         if unit in self._duplicate_symbols:
             duplicate_entry = self._duplicate_symbols[unit]
             raise AmbiguousUnitSymbolError(
@@ -59,11 +87,89 @@ class Ledger:
                 "\n\t".join(duplicate_entry.list_str()) +
                 "Try another approach to entering your desired unit.(use full name, prefix*unit, etc.)"
             )
+        if self.lazy_prefixes:
+            return self._get_prefixed_entry(unit)
 
         return None
 
+    def get_entry_by_label(self, label: str) -> Entry | None:
+        """ Unlike `get_entry`, only matches the label of the entry (not abbreviations or additional labels). """
+        if self._labels is None:
+            self._labels = {entry.label: entry for entry in self.units}
+
+        entry = self._labels.get(label)
+        if entry is None and self.lazy_prefixes:
+            entry = self._get_prefixed_entry(label)
+        return entry
+
+    @property
+    def version(self) -> int:
+        """ Hash of the entries (and their order); entry ids are only valid between ledgers with the same version. """
+        if self._version is None:
+            hash_ = zlib.crc32(f"{self.lazy_prefixes} {' '.join(self.prefixes)}".encode())
+            for entry in self.units:
+                hash_ = zlib.crc32(f"\n{entry.label} {entry.abbr}".encode(), hash_)
+            self._version = hash_
+        return self._version
+
+    def get_entry_id(self, entry: Entry) -> int:
+        """
+        Small integer id of an entry; the index in `units`. Lazy prefixed entries follow with
+        `len(units) + unit index * len(prefixes) + prefix index`, so ids don't depend on the resolution order.
+        """
+        if self._ids is None:
+            self._ids = {entry: i for i, entry in enumerate(self.units)}
+
+        id_ = self._ids.get(entry)
+        if id_ is None:
+            if entry not in self._unprefixed:
+                raise ValueError(f"'{entry.label}' is not an entry of the ledger.")
+            pre, unprefixed = self._unprefixed[entry]
+            id_ = len(self.units) + self.get_entry_id(unprefixed) * len(self._prefix_list) \
+                + self._prefix_list.index(pre)
+            self._ids[entry] = id_
+        return id_
+
+    def get_entry_by_id(self, id_: int) -> Entry:
+        """ Inverse of `get_entry_id`. """
+        units = self.units
+        if 0 <= id_ < len(units):
+            return units[id_]
+
+        index, pre = divmod(id_ - len(units), len(self._prefix_list))
+        if not self.lazy_prefixes or not 0 <= index < len(units):
+            raise ValueError(f"No entry with the id '{id_}' in the ledger.")
+        return self._get_prefixed(self._prefix_list[pre], units[index])
+
+    def units_for(self, dimension: dim_.Dimension | bases.BaseSet | str | tuple[int | float, ...]) \
+            -> tuple[Entry, ...]:
+        """
+        Entries with the dimension (in ledger order). 'dimension' is anything with a `dimension_signature` (Dimension,
+        BaseSet, Unit), a signature or a name in `classes` (e.g. 'energy'). With lazy prefixes only the unprefixed
+        entries are included.
+        """
+        if isinstance(dimension, str):
+            name, dimension = dimension, self.classes.get(dimension)
+            if not isinstance(dimension, dim_.Dimension):
+                raise ValueError(f"'{name}' is not a dimension in the ledger classes.")
+        if not isinstance(dimension, tuple):
+            dimension = dimension.dimension_signature
+
+        if self._dimension_index is None:
+            index = dict()
+            for entry in self.units:
+                index.setdefault(entry.base_unit.dimension_signature, []).append(entry)
+            self._dimension_index = {signature: tuple(entries) for signature, entries in index.items()}
+
+        return self._dimension_index.get(dimension, ())
+
     def add_unit(self, entry: Entry):
         self.units.append(entry)
+        self._symbols = None
+        self._labels = None
+        self._ids = None
+        self._version = None
+        self._dimension_index = None
 
         if entry.label in self._lookup or entry.label in self._duplicate_symbols:
             self._duplicate(entry, entry.label)
@@ -92,8 +198,62 @@ class Ledger:
             duplicate_entry = self._duplicate_symbols[symbol]
             duplicate_entry.entries.append(entry)
 
+    def add_prefixable(self, entry: Entry):
+        """ Register an unprefixed entry whose prefixed forms are resolved on demand (lazy prefixes). """
+        self._prefixable.setdefault(entry.label, []).append((entry, "label"))
+        self._prefixable.setdefault(entry.abbr, []).append((entry, "abbr"))
+        # same rule as `get_additional_labels`
+        if len(entry.additional_labels) > 1:
+            for label in entry.additional_labels:
+                self._prefixable.setdefault(label, []).append((entry, "additional_labels"))
+
+    def _get_prefixed_entry(self, symbol: str) -> Entry | None:
+        """
+        Split a prefix off the symbol and build the prefixed entry; this accepts the same symbols as the eagerly
+        built ledger.
+        """
+        entry = self._prefixed_lookup.get(symbol)
+        if entry is not None:
+            return entry
+
+        candidates = dict()
+        for pre in self.prefixes.values():
+            for pre_symbol in {pre.label, *pre.abbr}:
+                if not symbol.startswith(pre_symbol) or symbol == pre_symbol:
+                    continue
+
+                for entry, kind in self._prefixable.get(symbol[len(pre_symbol):], ()):
+                    if (kind == "label" and pre_symbol == pre.label) \
+                            or (kind == "abbr" and pre_symbol == pre.abbr[0]) \
+                            or (kind == "additional_labels" and pre_symbol in pre.abbr):
+                        candidates[(pre.label, id(entry))] = (pre, entry)
+
+        if not candidates:
+            return None
+        if len(candidates) > 1:
+            raise AmbiguousUnitSymbolError(
+                f"Unit '{symbol}' is ambiguous. It could correspond to the following units:\n\t" +
+                "\n\t".join(pre.label + entry.label for pre, entry in candidates.values()) +
+                "\nTry another approach to entering your desired unit.(use full name, prefix*unit, etc.)"
+            )
+
+        pre, entry = candidates.popitem()[1]
+        prefixed = self._get_prefixed(pre, entry)
+        self._prefixed_lookup[symbol] = prefixed
+        return prefixed
+
+    def _get_prefixed(self, pre: prefix_.Prefix, entry: Entry) -> Entry:
+        """ Prefixed form of an unprefixed entry (lazy prefixes); built once, as units compare entries by identity. """
+        key = (pre.label, id(entry))
+        prefixed = self._prefixed.get(key)
+        if prefixed is None:
+            prefixed = self._prefixed[key] = get_prefixed_entry(pre, entry)
+            self._unprefixed[prefixed] = (pre, entry)
+        return prefixed
+
     def add_in_main_duplicates(self):
         """ For duplicates keep the none prefix value. """
+        self._symbols = None
         for symbol, duplicate in self._duplicate_symbols.items():
             # if only one entry has no prefix
             if [entry.prefix is None for entry in duplicate.entries].count(True) == 1:
@@ -102,74 +262,111 @@ class Ledger:
                         self._lookup[symbol] = entry
                         break
 
-    def _save_cache(self):
-        a = self.symbols  # cause it to build
-
-        import pathlib
-        file = pathlib.Path(__file__).parent / pathlib.Path("_ledger_cache.pickle")
-        import pickle
-        with open(file, 'wb') as f:
-            pickle.dump(self, f, pickle.HIGHEST_PROTOCOL)
+    def to_snapshot(self) -> dict:
+        """ Compact form of the ledger built only from python literals (so it can be stored with `marshal`). """
+        index = {id(entry): i for i, entry in enumerate(self.units)}
+        base_sets = dict()
+        entries = []
+        for entry in self.units:
+            base_set = entry.base_unit.exponents
+            entries.append([
+                entry.label,
+                entry.abbr,
+                base_sets.setdefault(base_set, len(base_sets)),
+                entry._multiplier,
+                entry.offset,
+                entry.prefix.label if entry.prefix is not None else None,
+                entry.additional_labels
+            ])
+
+        return {
+            "lazy_prefixes": self.lazy_prefixes,
+            "base_sets": list(base_sets),
+            "entries": entries,
+            "lookup": {symbol: index[id(entry)] for symbol, entry in self._lookup.items()},
+            "duplicates": {symbol: [index[id(entry)] for entry in duplicate.entries]
+                           for symbol, duplicate in self._duplicate_symbols.items()},
+            "prefixable": {symbol: [[index[id(entry)], kind] for entry, kind in entries_]
+                           for symbol, entries_ in self._prefixable.items()},
+        }
 
     @classmethod
-    def _load_cache(cls):
-        import pathlib
-        file = pathlib.Path(__file__).parent / pathlib.Path("_ledger_cache.pickle")
-        if file.exists():
-            cls._cache = True
-            import pickle
-            with open(file, 'rb') as f:
-                return pickle.load(f)
-
-        return None
-
+    def from_snapshot(cls, snapshot: dict) -> Ledger:
+        ledger_ = cls(snapshot["lazy_prefixes"])
+        ledger_._cache = True
+
+        base_sets = [bases.BaseSet.from_exponents(base_set) for base_set in snapshot["base_sets"]]
+        units = ledger_.units
+        for label, abbr, base_set, multiplier, offset, prefix, additional_labels in snapshot["entries"]:
+            units.append(
+                Entry(label, abbr, base_sets[base_set], multiplier, offset,
+                      cls.prefixes[prefix] if prefix is not None else None, additional_labels)
+            )
 
-ledger = Ledger()
+        ledger_._lookup = {symbol: units[i] for symbol, i in snapshot["lookup"].items()}
+        ledger_._duplicate_symbols = {symbol: DuplicateEntry(symbol, [units[i] for i in indexes])
+                                      for symbol, indexes in snapshot["duplicates"].items()}
+        ledger_._prefixable = {symbol: [(units[i], kind) for i, kind in entries_]
+                               for symbol, entries_ in snapshot["prefixable"].items()}
+        return ledger_
 
 
-def add_bases():
+def add_bases(ledger_: Ledger):
     for base in bases.bases.values():
         if base.label == "kilogram":
             continue  # add separately
 
         base_entry = Entry(label=base.label, abbr=base.abbr, base_unit=bases.BaseSet(**{base.label: 1}), multiplier=1)
-        ledger.add_unit(base_entry)
-        add_with_prefix(base_entry)
+        ledger_.add_unit(base_entry)
+        add_with_prefix(ledger_, base_entry)
 
 
-def add_kilogram():
+def add_kilogram(ledger_: Ledger):
     base_entry = Entry(label="gram", abbr="g", base_unit=bases.BaseSet(kilogram=1), multiplier=0.001)
-    ledger.add_unit(base_entry)
-    add_with_prefix(base_entry)
+    ledger_.add_unit(base_entry)
+    add_with_prefix(ledger_, base_entry)
+
 
+def add_derived_quantities(ledger_: Ledger):
+    import unitpy.definitions.unit_derived as unit_derived
 
-def add_derived_quantities():
     for entry in unit_derived.derived_quantities.values():
-        ledger.add_unit(entry)
-        add_with_prefix(entry)
-
-
-def add_with_prefix(entry: Entry):
-    for pre in ledger.prefixes.values():
-        ledger.add_unit(
-            Entry(
-                label=pre.label + entry.label,
-                abbr=pre.abbr[0] + entry.abbr,
-                base_unit=entry.base_unit,
-                multiplier=entry.multiplier,
-                prefix=pre,
-                additional_labels=get_additional_labels(pre.abbr, entry.additional_labels)
-            )
-        )
+        ledger_.add_unit(entry)
+        add_with_prefix(ledger_, entry)
+
+
+def add_with_prefix(ledger_: Ledger, entry: Entry):
+    if ledger_.lazy_prefixes:
+        ledger_.add_prefixable(entry)
+        return
+
+    for pre in ledger_.prefixes.values():
+        ledger_.add_unit(get_prefixed_entry(pre, entry))
+
+
+def get_prefixed_entry(pre: prefix_.Prefix, entry: Entry) -> Entry:
+    return Entry(
+        label=pre.label + entry.label,
+        abbr=pre.abbr[0] + entry.abbr,
+        base_unit=entry.base_unit,
+        multiplier=entry.multiplier,
+        prefix=pre,
+        additional_labels=get_additional_labels(pre.abbr, entry.additional_labels)
+    )
 
 
-def add_core():
+def add_core(ledger_: Ledger):
+    import unitpy.definitions.unit_NIST as unit_NIST
+
     # for group in groups_names:
     for group in unit_NIST.units_NIST.values():
         # base
-        base_unit = group.pop("base")
+        base_unit = group["base"]
 
         for label, value in group.items():
+            if label == "base":
+                continue
+
             entry = Entry(
                 label=label,
                 abbr=value["abbr"],
@@ -178,8 +375,8 @@ def add_core():
                 offset=value["offset"] if "offset" in value else None,
                 additional_labels=value["additional_labels"] if "additional_labels" in value else [],
             )
-            ledger.add_unit(entry)
-            add_with_prefix(entry)
+            ledger_.add_unit(entry)
+            add_with_prefix(ledger_, entry)
 
 
 def get_additional_labels(pre: list[str, ...], labels: list[str, ...]) -> list:
@@ -191,21 +388,103 @@ def get_additional_labels(pre: list[str, ...], labels: list[str, ...]) -> list:
     return ["".join(i) for i in itertools.product(pre, labels)]
 
 
-add_bases()
-add_kilogram()
-add_derived_quantities()
-add_core()
-
-
 ## add unofficial NIST units ## noqa
 #######################################################################################################################
 
-def add_extra_quantities():
+def add_extra_quantities(ledger_: Ledger):
+    import unitpy.definitions.unit_extra as unit_extra
+
     for entry in unit_extra.extra_quantities.values():
-        ledger.add_unit(entry)
+        ledger_.add_unit(entry)
+
 
+def build_ledger(lazy_prefixes: bool | None = None) -> Ledger:
+    """ Build the ledger from the unit definitions. """
+    ledger_ = Ledger(lazy_prefixes)
+    add_bases(ledger_)
+    add_kilogram(ledger_)
+    add_derived_quantities(ledger_)
+    add_core(ledger_)
+    add_extra_quantities(ledger_)
+    ledger_.add_in_main_duplicates()
+    return ledger_
 
-add_extra_quantities()
 
+## ledger snapshot ## noqa
+#######################################################################################################################
 
-ledger.add_in_main_duplicates()
\ No newline at end of file
+def get_cache_dir() -> pathlib.Path:
+    if CONFIG.cache_dir is not None:
+        return pathlib.Path(CONFIG.cache_dir)
+
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or pathlib.Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        root = pathlib.Path.home() / "Library" / "Caches"
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+
+    return pathlib.Path(root) / "unitpy"
+
+
+def get_snapshot_path(lazy_prefixes: bool) -> pathlib.Path:
+    return get_cache_dir() / ("ledger_lazy.snapshot" if lazy_prefixes else "ledger.snapshot")
+
+
+def get_definitions_hash() -> int:
+    """
+    Hash of the unit definitions and the python version (the marshal format is version specific); a snapshot is only
+    used if it was written with the same hash.
+    """
+    hash_ = zlib.crc32(f"{SNAPSHOT_FORMAT} {sys.version_info[:2]} {marshal.version}".encode())
+    for file in sorted(pathlib.Path(__file__).parent.glob("*.py")):
+        hash_ = zlib.crc32(file.name.encode(), hash_)
+        hash_ = zlib.crc32(file.read_bytes(), hash_)
+
+    return hash_
+
+
+def save_snapshot(ledger_: Ledger, file: pathlib.Path, hash_: int):
+    snapshot = {"format": SNAPSHOT_FORMAT, "hash": hash_, **ledger_.to_snapshot()}
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        with open(temp_file, "wb") as f:
+            marshal.dump(snapshot, f)
+        os.replace(temp_file, file)  # atomic, so other processes never read a partial file
+    except OSError:
+        pass  # read-only or missing cache directory; the ledger is just rebuilt on the next import
+
+
+def load_ledger() -> Ledger:
+    """
+    Load the ledger from the snapshot in the user cache directory. The snapshot is (re)built when it is missing, was
+    written by a different snapshot format or the unit definitions changed.
+    """
+    if not CONFIG.ledger_cache:
+        return build_ledger()
+
+    file = get_snapshot_path(CONFIG.lazy_prefixes)
+    hash_ = get_definitions_hash()
+    try:
+        with open(file, "rb") as f:
+            snapshot = marshal.loads(f.read())
+        if snapshot["format"] == SNAPSHOT_FORMAT and snapshot["hash"] == hash_:
+            return Ledger.from_snapshot(snapshot)
+    except (OSError, EOFError, ValueError, LookupError, TypeError):
+        pass  # missing or corrupt snapshot
+
+    ledger_ = build_ledger()
+    save_snapshot(ledger_, file, hash_)
+    return ledger_
+
+
+ledger = load_ledger()
+
+
+def get_entry_by_label(label: str) -> Entry:
+    """ Used to unpickle `Entry` objects. """
+    entry = ledger.get_entry_by_label(label)
+    if entry is None:
+        raise ValueError(f"No unit with the label '{label}' in the ledger.")
+    return entry
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import operator
+
 from unitpy.definitions.dimensions import BaseDimension, Dimension, dimensions
 from unitpy.utils.equation_formating import equation_formater
 
@@ -66,7 +68,13 @@ bases = {
 
 
 class BaseSet:
-    __slots__ = ("meter", "second", "mole", "kelvin", "candela", "kilogram", "ampere")  # DON'T change order
+    """
+    Exponents of the SI base units. Stored as a tuple (in the order of `base_labels`) with the hash precomputed;
+    in-place operators return a new BaseSet. Assigning an exponent (`base_set.meter = 1`) replaces the tuple and
+    hash; don't assign to a BaseSet that is in use (e.g. the `base_unit` of an entry).
+    """
+    __slots__ = ("_exponents", "_hash")
+    base_labels = ("meter", "second", "mole", "kelvin", "candela", "kilogram", "ampere")  # DON'T change order
     _bases = bases
 
     def __init__(self,
@@ -79,13 +87,24 @@ class BaseSet:
                  ampere: int | float = 0,
                  ):
         # DON'T change order
-        self.meter = meter
-        self.second = second
-        self.mole = mole
-        self.kelvin = kelvin
-        self.candela = candela
-        self.kilogram = kilogram
-        self.ampere = ampere
+        self._exponents = (meter, second, mole, kelvin, candela, kilogram, ampere)
+        self._hash = hash(self._exponents)
+
+    @classmethod
+    def from_exponents(cls, exponents: tuple[int | float, ...]) -> BaseSet:
+        base_set = object.__new__(cls)
+        base_set._exponents = exponents
+        base_set._hash = hash(exponents)
+        return base_set
+
+    def _set_exponent(self, index: int, value: int | float):
+        exponents = list(self._exponents)
+        exponents[index] = value
+        self._exponents = tuple(exponents)
+        self._hash = hash(self._exponents)
+
+    def __reduce__(self):
+        return BaseSet.from_exponents, (self._exponents,)
 
     def __str__(self):
         return self.label
@@ -97,64 +116,108 @@ class BaseSet:
         if not isinstance(other, BaseSet):
             raise TypeError("Equality can only be done between BaseSets.")
 
-        for base in self.__slots__:
-            if getattr(self, base) != getattr(other, base):
-                return False
-
-        return True
+        return self._hash == other._hash and self._exponents == other._exponents
 
     def __hash__(self):
-        return hash(tuple([type(self).__name__] + [getattr(self, base) for base in self.__slots__]))
+        return self._hash
 
     def __mul__(self, other: BaseSet) -> BaseSet:
         if not isinstance(other, BaseSet):
             raise TypeError("Can only add 'BaseSet' with 'BaseSet'.")
 
-        return BaseSet(**{base: getattr(self, base) + getattr(other, base) for base in self.__slots__})
-
-    def __imul__(self, other: BaseSet) -> BaseSet:
-        if not isinstance(other, BaseSet):
-            raise TypeError("Can only add 'BaseSet' with 'BaseSet'.")
-
-        for base in self.__slots__:
-            setattr(self, base, getattr(self, base) + getattr(other, base))
-        return self
+        return BaseSet.from_exponents(tuple(map(operator.add, self._exponents, other._exponents)))
 
+    __imul__ = __mul__
     __rmul__ = __mul__
 
     def __truediv__(self, other):
         if not isinstance(other, BaseSet):
             raise TypeError("Can only subtract 'BaseSet' with 'BaseSet'.")
 
-        return BaseSet(**{base: getattr(self, base) - getattr(other, base) for base in self.__slots__})
-
-    def __itruediv__(self, other):
-        if not isinstance(other, BaseSet):
-            raise TypeError("Can only subtract 'BaseSet' with 'BaseSet'.")
+        return BaseSet.from_exponents(tuple(map(operator.sub, self._exponents, other._exponents)))
 
-        for base in self.__slots__:
-            setattr(self, base, getattr(self, base) - getattr(other, base))
-        return self
+    __itruediv__ = __truediv__
 
     def __rtruediv__(self, other):
         if not isinstance(other, BaseSet):
             raise TypeError("Can only subtract 'BaseSet' with 'BaseSet'.")
 
-        return BaseSet(**{base: getattr(other, base) - getattr(self, base) for base in self.__slots__})
+        return BaseSet.from_exponents(tuple(map(operator.sub, other._exponents, self._exponents)))
 
     def __pow__(self, power: int | float) -> BaseSet:
         if isinstance(power, int) or isinstance(power, float):
-            return BaseSet(**{base: getattr(self, base) * power for base in self.__slots__})
+            if power == 1:
+                return BaseSet.from_exponents(self._exponents)  # a copy, as exponents can be assigned
+            return BaseSet.from_exponents(tuple(map(operator.mul, self._exponents, (power,) * 7)))
         else:
             raise TypeError("Power must be a 'int' or 'float'.")
 
-    def __ipow__(self, power: int | float) -> BaseSet:
-        if isinstance(power, int) or isinstance(power, float):
-            for base in self.__slots__:
-                setattr(self, base, getattr(self, base) * power)
-            return self
-        else:
-            raise TypeError("Power must be a 'int' or 'float'.")
+    __ipow__ = __pow__
+
+    @property
+    def exponents(self) -> tuple[int | float, ...]:
+        return self._exponents
+
+    @property
+    def dimension_signature(self) -> tuple[int | float, ...]:
+        """ Hashable dimension of the base set; equal signatures means compatible units. """
+        return self._exponents
+
+    @property
+    def meter(self) -> int | float:
+        return self._exponents[0]
+
+    @meter.setter
+    def meter(self, value: int | float):
+        self._set_exponent(0, value)
+
+    @property
+    def second(self) -> int | float:
+        return self._exponents[1]
+
+    @second.setter
+    def second(self, value: int | float):
+        self._set_exponent(1, value)
+
+    @property
+    def mole(self) -> int | float:
+        return self._exponents[2]
+
+    @mole.setter
+    def mole(self, value: int | float):
+        self._set_exponent(2, value)
+
+    @property
+    def kelvin(self) -> int | float:
+        return self._exponents[3]
+
+    @kelvin.setter
+    def kelvin(self, value: int | float):
+        self._set_exponent(3, value)
+
+    @property
+    def candela(self) -> int | float:
+        return self._exponents[4]
+
+    @candela.setter
+    def candela(self, value: int | float):
+        self._set_exponent(4, value)
+
+    @property
+    def kilogram(self) -> int | float:
+        return self._exponents[5]
+
+    @kilogram.setter
+    def kilogram(self, value: int | float):
+        self._set_exponent(5, value)
+
+    @property
+    def ampere(self) -> int | float:
+        return self._exponents[6]
+
+    @ampere.setter
+    def ampere(self, value: int | float):
+        self._set_exponent(6, value)
 
     @property
     def label(self) -> str:
@@ -170,11 +233,11 @@ class BaseSet:
 
     @property
     def dimensionless(self) -> bool:
-        return self.dimensionality.dimensionless
+        return not any(self._exponents)
 
     def as_dict(self) -> dict[BaseUnit, int | float]:
-        return {self._bases[attr_name]: getattr(self, attr_name) for attr_name in self.__slots__}
+        return {self._bases[label]: value for label, value in zip(self.base_labels, self._exponents)}
 
     # @classmethod
     # def from_string(cls, unit: str) -> BaseSet:
-    #     return BaseSet(**parse_base(unit, set(BaseSet.__slots__)))
+    #     return BaseSet(**parse_base(unit, set(BaseSet.base_labels)))
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from inspect import signature
 from itertools import chain
 
@@ -6,7 +8,9 @@ try:
 except ImportError:
     raise ImportError("Must install numpy to use. `pip install numpy`")
 
+from unitpy.errors import UnitDimensionError
 from unitpy.core import Quantity, Unit
+from unitpy.quantity_array import QuantityArray
 
 HANDLED_UFUNCS = {}
 HANDLED_FUNCTIONS = {}
@@ -38,14 +42,20 @@ def _get_first_input_unit(args, kwargs=None) -> Unit:
     raise TypeError("Expected at least one Quantity; found none")
 
 
+def _value_in_unit(quantity: Quantity, unit_: Unit):
+    if quantity.unit is unit_:
+        return quantity.v
+    return quantity.to(unit_).v
+
+
 def convert_to_consistent_unit(*args: Quantity, unit_: Unit, **kwargs):  # -> tuple[tuple[Quantity], dict]:
     if kwargs:
-        kwargs = {k: v.to(unit_).v for k, v in kwargs.items()}
+        kwargs = {k: _value_in_unit(v, unit_) for k, v in kwargs.items()}
 
     args_ = []
     for arg in args:
         if hasattr(arg, "to"):
-            args_.append(arg.to(unit_).v)
+            args_.append(_value_in_unit(arg, unit_))
         elif isinstance(arg, np.ndarray):
             args_.append(arg)
         else:
@@ -630,6 +640,41 @@ def _prod(a, *args, **kwargs):
 # Implement simple matching-unit or stripped-unit functions based on signature
 
 
+def get_argument_positions(func, labels) -> tuple[tuple[str, int | None], ...]:
+    """Position of each argument in the signature of `func` (None if it can only be given by keyword).
+
+    Computed once at registration, so the wrappers don't need `signature(func).bind()` on every call.
+    """
+    positions = {}
+    for i, parameter in enumerate(signature(func).parameters.values()):
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            positions[parameter.name] = i
+    return tuple((label, positions.get(label)) for label in labels)
+
+
+def get_arguments(args: tuple, kwargs: dict, positions: tuple[tuple[str, int | None], ...]) -> dict:
+    """Given (not None) arguments from args/kwargs; {label: (position or label, value)}."""
+    arguments = {}
+    for label, i in positions:
+        if i is not None and i < len(args):
+            if args[i] is not None:
+                arguments[label] = (i, args[i])
+        elif kwargs.get(label) is not None:
+            arguments[label] = (label, kwargs[label])
+    return arguments
+
+
+def set_arguments(args: tuple, kwargs: dict, arguments: dict, values) -> tuple[tuple, dict]:
+    args = list(args)
+    kwargs = dict(kwargs)
+    for (key, _), value in zip(arguments.values(), values):
+        if isinstance(key, int):
+            args[key] = value
+        else:
+            kwargs[key] = value
+    return tuple(args), kwargs
+
+
 def implement_consistent_unit_by_argument(func_str, unit_arguments, wrap_output=True):
     # If NumPy is not available, do not attempt implement that which does not exist
     if np is None:
@@ -648,27 +693,23 @@ def implement_consistent_unit_by_argument(func_str, unit_arguments, wrap_output=
     if func is None:
         return
 
+    if isinstance(unit_arguments, str):
+        unit_arguments = [unit_arguments]
+    positions = get_argument_positions(func, unit_arguments)
+
     @implements(func_str, "function")
     def implementation(*args, **kwargs):
-        # Bind given arguments to the NumPy function signature
-        bound_args = signature(func).bind(*args, **kwargs)
-
-        # Skip unit arguments that are supplied as None
-        valid_unit_arguments = [
-            label
-            for label in unit_arguments
-            if label in bound_args.arguments and bound_args.arguments[label] is not None
-        ]
+        # Skip unit arguments that are not given or supplied as None
+        arguments = get_arguments(args, kwargs, positions)
 
         # Unwrap valid unit arguments, ensure consistency, and obtain output wrapper
         unwrapped_unit_args, output_wrap = unwrap_and_wrap_consistent_unit(
-            *(bound_args.arguments[label] for label in valid_unit_arguments)
+            *(value for _, value in arguments.values())
         )
 
         # Call NumPy function with updated arguments
-        for i, unwrapped_unit_arg in enumerate(unwrapped_unit_args):
-            bound_args.arguments[valid_unit_arguments[i]] = unwrapped_unit_arg
-        ret = func(*bound_args.args, **bound_args.kwargs)
+        args, kwargs = set_arguments(args, kwargs, arguments, unwrapped_unit_args)
+        ret = func(*args, **kwargs)
 
         # Conditionally wrap output
         if wrap_output:
@@ -734,27 +775,21 @@ def implement_close(func_str):
         return
 
     func = getattr(np, func_str)
+    positions = get_argument_positions(func, ["a", "b", "atol"])
 
     @implements(func_str, "function")
     def implementation(*args, **kwargs):
-        bound_args = signature(func).bind(*args, **kwargs)
-        labels = ["a", "b"]
-        arrays = {label: bound_args.arguments[label] for label in labels}
-        if "atol" in bound_args.arguments:
-            atol = bound_args.arguments["atol"]
-            a = arrays["a"]
-            if not hasattr(atol, "_REGISTRY") and hasattr(a, "_REGISTRY"):
+        arguments = get_arguments(args, kwargs, positions)
+        if "atol" in arguments:
+            a = arguments["a"][1]
+            key, atol = arguments["atol"]
+            if not isinstance(atol, Quantity) and isinstance(a, Quantity):
                 # always use the units of `a`
-                atol_ = a._REGISTRY.Quantity(atol, a.units)
-            else:
-                atol_ = atol
-            arrays["atol"] = atol_
-
-        args, _ = unwrap_and_wrap_consistent_unit(*arrays.values())
-        for label, value in zip(arrays.keys(), args):
-            bound_args.arguments[label] = value
+                arguments["atol"] = (key, Quantity(atol, a.unit))
 
-        return func(*bound_args.args, **bound_args.kwargs)
+        values, _ = unwrap_and_wrap_consistent_unit(*(value for _, value in arguments.values()))
+        args, kwargs = set_arguments(args, kwargs, arguments, values)
+        return func(*args, **kwargs)
 
 
 for func_str in ("isclose", "allclose"):
@@ -854,9 +889,77 @@ for func_str in ["var", "nanvar"]:
     implement_func("function", func_str, input_unit=None, output_unit="variance")
 
 
-def numpy_wrap(func_type, func, args, kwargs, types):
-    """Return the result from a NumPy function/ufunc as wrapped by Pint."""
+# ufuncs that can run directly on the base values when given an `out=` QuantityArray
+# (base values are absolute, so sums are unit independent; products need units without offset)
+inplace_ufuncs = {
+    "add": "sum",
+    "subtract": "sum",
+    "multiply": "mul",
+    "true_divide": "div",
+    "divide": "div",
+    "negative": "copy",
+    "positive": "copy",
+    "absolute": "copy",
+}
+
 
+def _base_values_for_out(kind: str, inputs: tuple) -> tuple[tuple, Unit] | None:
+    """Base values of the inputs and the resulting unit, or None if the ufunc can't be done on base values."""
+    if kind == "sum":
+        x1, x2 = inputs
+        if not (isinstance(x1, Quantity) and isinstance(x2, Quantity)):
+            return None
+        if not x1.unit.is_compatible(x2.unit):
+            raise UnitDimensionError(f"Cannot add quantities with different units.\n{x1} + {x2}")
+        if x1.unit.offset != 0 or x2.unit.offset != 0:
+            return None  # e.g. degC - degC is a difference in K, not a difference of base values
+        return (x1._base_value, x2._base_value), x1.unit
+
+    values = []
+    unit = Unit()
+    for i, x in enumerate(inputs):
+        if isinstance(x, Quantity):
+            if x.unit.offset != 0:
+                return None
+            values.append(x._base_value)
+            unit = unit / x.unit if kind == "div" and i == 1 else unit * x.unit
+        else:
+            values.append(x)  # plain numbers/arrays are dimensionless
+    return tuple(values), unit
+
+
+def ufunc_out(ufunc, implementation, inputs: tuple, kwargs: dict) -> QuantityArray:
+    """Ufunc writing into the QuantityArray given by `out=`; done in place on the base values when possible."""
+    out = kwargs.pop("out")
+    if isinstance(out, tuple):
+        if len(out) != 1:
+            raise NotImplementedError("'out' is only supported for ufuncs with one output.")
+        out = out[0]
+    if not isinstance(out, QuantityArray):
+        raise TypeError(f"'out' must be a 'QuantityArray' (got {type(out)}).")
+
+    kind = inplace_ufuncs.get(ufunc.__name__)
+    if kind is not None and out.unit.offset == 0:
+        base_values = _base_values_for_out(kind, inputs)
+        if base_values is not None:
+            values, unit = base_values
+            if not out.unit.is_compatible(unit):
+                raise UnitDimensionError(f"Result can't be stored in 'out'.\n{unit} --> {out.unit}")
+            ufunc(*values, out=out._base_value, **kwargs)  # 'where' leaves the masked elements of 'out' as is
+            return out
+
+    where = kwargs.pop("where", True)
+    result = implementation(*inputs, **kwargs)
+    if not isinstance(result, Quantity) or not out.unit.is_compatible(result.unit):
+        raise UnitDimensionError(f"Result can't be stored in 'out'.\n{result} --> {out.unit}")
+    np.copyto(out._base_value, result._base_value, where=where)  # masked elements keep their values, like numpy
+    return out
+
+
+_dispatch = {}  # numpy function or ufunc object -> implementation (None if not handled)
+
+
+def get_implementation(func_type, func):
     if func_type == "function":
         handled = HANDLED_FUNCTIONS
         # Need to handle functions in submodules
@@ -868,6 +971,18 @@ def numpy_wrap(func_type, func, args, kwargs, types):
     else:
         raise ValueError("Invalid func_type {}".format(func_type))
 
-    if name not in handled:
+    return handled.get(name)
+
+
+def numpy_wrap(func_type, func, args, kwargs, types):
+    """Return the result from a NumPy function/ufunc as wrapped by Pint."""
+    try:
+        implementation = _dispatch[func]
+    except KeyError:
+        implementation = _dispatch[func] = get_implementation(func_type, func)
+
+    if implementation is None:
         raise NotImplementedError("Not Implemented")
-    return handled[name](*args, **kwargs)
+    if func_type == "ufunc" and kwargs.get("out") is not None:
+        return ufunc_out(func, implementation, args, kwargs)
+    return implementation(*args, **kwargs)
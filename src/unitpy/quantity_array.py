@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import copy
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("Must install numpy to use. `pip install numpy`")
+
+from unitpy.errors import UnitDimensionError
+from unitpy.config import CONFIG
+from unitpy.definitions.unit_base import BaseSet
+from unitpy.core import Unit, Quantity
+
+
+class QuantityArray(Quantity):
+    """
+    Array of quantities sharing one unit; the values are stored as a numpy array in base units.
+
+    Slicing returns views that share memory with the original array (indexing a single element returns a
+    'Quantity'). `value` and `np.asarray()` don't copy when the unit has no scale or offset to the base units.
+    `Quantity(array, unit)` and `array * unit` return a QuantityArray.
+    """
+    __slots__ = ()
+    __hash__ = None  # mutable, like numpy arrays
+
+    def __init__(self, value, unit: Unit | BaseSet | str = None):
+        if isinstance(unit, str) or isinstance(unit, BaseSet):
+            unit = Unit(unit)
+
+        value = np.array(value)  # copy; converted to base units in place
+        if value.dtype.kind in "biu":
+            value = value.astype(float)  # base values are scaled, and in-place math must not truncate
+
+        self._unit = unit
+        self._base_value = unit.to_base_value(value, out=value)
+
+    @classmethod
+    def from_strings(cls, quantities) -> QuantityArray:
+        """ QuantityArray from quantity strings, e.g. ["12.3 psi", "14.1 psi"]; see 'parse_quantities'. """
+        from unitpy.utils.parsing import parse_quantities
+        return parse_quantities(quantities)
+
+    def __repr__(self):
+        return f"QuantityArray({self.value!r}, '{self.unit}')"
+
+    def __copy__(self) -> QuantityArray:
+        return QuantityArray._from_base(self._base_value.copy(), self._unit)
+
+    def __deepcopy__(self, memo) -> QuantityArray:
+        return QuantityArray._from_base(self._base_value.copy(), copy.deepcopy(self._unit))
+
+    def __array__(self, dtype=None, copy: bool | None = None) -> np.ndarray:
+        value = self._value
+        if dtype is not None and value.dtype != dtype:
+            return value.astype(dtype)
+        if copy and value is self._base_value:
+            return value.copy()
+        return value
+
+    def __len__(self) -> int:
+        return len(self._base_value)
+
+    def __iter__(self):
+        for i in range(len(self._base_value)):
+            yield self[i]
+
+    def __getitem__(self, key) -> QuantityArray | Quantity:
+        base_value = self._base_value[key]
+        if isinstance(base_value, np.ndarray):
+            return QuantityArray._from_base(base_value, self._unit)
+        return Quantity._from_base(base_value, self._unit)
+
+    def __setitem__(self, key, value: Quantity):
+        if not isinstance(value, Quantity) or not self._unit.is_compatible(value._unit):
+            raise UnitDimensionError(f"Can only assign quantities with compatible units.\n{self} <-- {value}")
+
+        self._base_value[key] = value._base_value
+
+    def __add__(self, other: Quantity) -> QuantityArray:
+        if self._is_compatible(other):
+            return QuantityArray._from_base(self._base_value + other._base_value, self._unit)
+        return super().__add__(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Quantity) -> QuantityArray:
+        if self._is_compatible(other):
+            return QuantityArray._from_base(self._base_value - other._base_value, self._unit)
+        return super().__sub__(other)
+
+    def __rsub__(self, other: Quantity) -> QuantityArray:
+        if self._is_compatible(other):
+            return QuantityArray._from_base(other._base_value - self._base_value, self._unit)
+        return super().__rsub__(other)
+
+    @property
+    def _value(self) -> np.ndarray:
+        return self._unit.from_base_value(self._base_value)  # no copy if the unit has no scale or offset
+
+    @property
+    def value(self) -> np.ndarray:
+        value = self._value
+        if CONFIG.precision is not None:
+            value = np.round(value, CONFIG.precision)
+        return value
+
+    @property
+    def base_value(self) -> np.ndarray:
+        value = self._base_value
+        if CONFIG.precision is not None:
+            value = np.round(value, CONFIG.precision)
+        return value
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._base_value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self._base_value.ndim
+
+    @property
+    def size(self) -> int:
+        return self._base_value.size
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._base_value.dtype
+
+    def to(self, unit: str | Unit) -> QuantityArray:
+        if isinstance(unit, str):
+            unit = Unit(unit)
+
+        if not self._unit.is_compatible(unit):
+            raise UnitDimensionError(f"Units are not compatible.\n{self} --> {unit}")
+
+        # base values don't depend on the unit; only the unit changes
+        return QuantityArray._from_base(self._base_value.copy(), unit)
+
+    def is_close(self, other: Quantity, rel_tol: int | float = 1e-9, abs_tol: Quantity = None) -> np.ndarray:
+        """ Element-wise True where the other quantity is close to this quantity. """
+        self._comparison_check(other)
+        if abs_tol is None:
+            abs_tol = 0
+        else:
+            abs_tol = abs_tol.base_value
+        return np.isclose(self._base_value, other._base_value, rtol=rel_tol, atol=abs_tol)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+from unitpy.config import CONFIG
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    Size-bounded least recently used cache.
+
+    The size limit is read from `CONFIG.<size_attr>` so it can be changed (or set to 0 to disable the cache) at
+    runtime.
+    """
+    __slots__ = ("size_attr", "hits", "misses", "_data")
+
+    def __init__(self, size_attr: str):
+        self.size_attr = size_attr
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __str__(self):
+        return f"LRUCache({self.size_attr}: {self.info()})"
+
+    __repr__ = __str__
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def maxsize(self) -> int:
+        return getattr(CONFIG, self.size_attr)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        maxsize = self.maxsize
+        if not maxsize:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > maxsize:
+            self._data.popitem(last=False)
+
+    __setitem__ = put
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
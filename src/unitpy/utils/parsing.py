@@ -1,10 +1,26 @@
 from __future__ import annotations
 
 import re
+from typing import Iterable
 
-from unitpy.errors import UnSupportedUnitError
+from unitpy.errors import UnSupportedUnitError, UnitDimensionError
 from unitpy.definitions.ledger import ledger
-from unitpy.core import Unit, Quantity
+from unitpy.core import Unit, Quantity, CompiledUnit
+from unitpy.utils.cache import LRUCache
+
+# parsed unit strings; `Unit` objects are not mutated in place so results can be shared
+unit_cache = LRUCache("parse_cache_size")
+# compiled unit strings ('CompiledUnit'); kept apart from the units as interned units are only weakly referenced
+compiled_cache = LRUCache("parse_cache_size")
+
+
+# leading number of a quantity string: sign, digits with '_' separators, fraction, exponent, 'inf' or 'nan'
+# (what `float()` accepts); the regex is a single left-to-right scan
+number_pattern = re.compile(
+    r"\s*([-+]?(?:(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)(?:[eE][-+]?\d(?:_?\d)*)?"
+    r"|inf(?:inity)?|nan))",
+    re.IGNORECASE
+)
 
 
 def convert_to_number(value: str) -> int | float:
@@ -16,18 +32,12 @@ def convert_to_number(value: str) -> int | float:
 
 
 def get_value(text: str) -> tuple[int | float, str]:
-    best_index = 0
-    for i in range(len(text) + 1):
-        try:
-            float(text[:i])
-            best_index = i
-        except ValueError:
-            pass
-
-    if best_index == 0:
+    """ Splits the leading number off a quantity string in one pass; ("1.5e3 m/s") --> (1500, " m/s"). """
+    match = number_pattern.match(text)
+    if match is None:
         raise ValueError(f"No value detected in : {text}")
 
-    return convert_to_number(text[:best_index]), text[best_index:]
+    return convert_to_number(match.group(1)), text[match.end():]
 
 
 def parse_quantity(quantity: str) -> Quantity:
@@ -38,45 +48,213 @@ def parse_quantity(quantity: str) -> Quantity:
     return value * unit
 
 
+def parse_quantities(quantities: Iterable[str]) -> QuantityArray:
+    """
+    Parses many quantity strings (e.g. a column of "12.3 psi" cells) into one QuantityArray.
+
+    Each distinct unit string is parsed once and the numbers are converted to floats in one numpy call. All units
+    must be compatible; the result is in the unit of the first string. A numpy array of strings keeps its shape.
+    """
+    import numpy as np
+    from unitpy.quantity_array import QuantityArray
+
+    shape = None
+    if isinstance(quantities, np.ndarray):
+        shape = quantities.shape
+        quantities = quantities.ravel().tolist()
+
+    numbers = []
+    groups: dict[str, list[int]] = {}  # unit string -> indices
+    for i, quantity in enumerate(quantities):
+        match = number_pattern.match(quantity)
+        if match is None:
+            raise ValueError(f"No value detected in : {quantity}")
+        numbers.append(match.group(1))
+        unit = quantity[match.end():].strip().lstrip("*")
+        indices = groups.get(unit)
+        if indices is None:
+            groups[unit] = [i]
+        else:
+            indices.append(i)
+
+    if not numbers:
+        raise ValueError("No quantities given.")
+
+    values = np.array(numbers, dtype=float)
+    result_unit = None
+    for unit, indices in groups.items():
+        unit = parse_unit(unit)
+        if result_unit is None:
+            result_unit = unit
+        elif not result_unit.is_compatible(unit):
+            raise UnitDimensionError(f"All quantities must have compatible units.\n{result_unit} <--> {unit}")
+
+        if len(indices) == len(values):
+            unit.to_base_value(values, out=values)
+        else:
+            values[indices] = unit.to_base_value(values[indices])
+
+    if shape is not None:
+        values = values.reshape(shape)
+    return QuantityArray._from_base(values, result_unit)
+
+
 def parse_unit(unit: str) -> Unit:
     if unit == "":
         return Unit()
 
-    parser = Parser(unit)
-    result = parser.parse()
-    if not isinstance(result, Unit):
-        raise ValueError(f"Provided string is not a unit: {unit}")
+    result = unit_cache.get(unit)
+    if result is None:
+        result = Unit._from_compiled(compile_unit(unit))
+        unit_cache[unit] = result
 
     return result
 
 
+def compile_unit(unit: str) -> CompiledUnit:
+    """
+    Compiled form of a unit string: flat (Entry, exponent) pairs with the multiplier, offset and base signature
+    precomputed. Results are cached; a Unit is made from it with 'Unit._from_compiled' (one dict construction).
+    """
+    result = compiled_cache.get(unit)
+    if result is None:
+        result = _compile_unit(unit)
+        compiled_cache[unit] = result
+
+    return result
+
+
+def _compile_unit(unit: str) -> CompiledUnit:
+    parser = Parser(unit, compiled=True)
+    try:
+        result = parser.parse()
+    except _NotAUnit:
+        result = None
+    if not isinstance(result, _Term):
+        raise ValueError(f"Provided string is not a unit: {unit}")
+
+    return CompiledUnit.from_dict(result)
+
+
 def parse_base(unit: str, symbols: set[str, ...]) -> dict[str, float | int]:
     pass
     # parser = Parser(unit, symbols)
     # return parser.parse()
 
 
+# one token per match: whitespace, number, name or operator ('**' is the same as '^')
+token_pattern = re.compile(r"(\s+)|(\d+(?:\.\d*)?)|([a-zA-Z_]+)|(\*\*|[-+*/^()])")
+
+
+def tokenize(expression: str) -> list[tuple[str, int | float | str | None, int]]:
+    """
+    Splits a unit expression into (kind, value, position) tokens in one pass over the string.
+    kind is "number", "name" or the operator character. A space between two names/numbers is a multiplication
+    ('kg m' --> 'kg*m') and ' per ' is a division.
+    """
+    tokens = []
+    match = token_pattern.match
+    length = len(expression)
+    pos = 0
+    space = False
+    while pos < length:
+        token = match(expression, pos)
+        if token is None:
+            raise ValueError('Unexpected character at position ' + str(pos) +
+                             f"\ntext: {expression}\n      {' ' * pos}^")
+
+        end = token.end()
+        if token.lastindex == 1:
+            space = True
+            pos = end
+            continue
+
+        if token.lastindex == 4:
+            op = token.group(4)
+            tokens.append(("^" if op == "**" else op, None, pos))
+        elif space and token.lastindex == 3 and token.group(3) == "per" and expression[end:end + 1].isspace():
+            tokens.append(("/", None, pos))
+        else:
+            if space and tokens and tokens[-1][0] in ("number", "name"):
+                tokens.append(("*", None, pos))
+            if token.lastindex == 2:
+                tokens.append(("number", convert_to_number(token.group(2)), pos))
+            else:
+                tokens.append(("name", token.group(3), pos))
+        space = False
+        pos = end
+
+    return tokens
+
+
+class _NotAUnit(ValueError):
+    """ A number was combined with a '_Term'; '_compile_unit' re-raises it with the unit string. """
+
+
+class _Term(dict):
+    """
+    {Entry: exponent} of a unit expression while it is being compiled; merged in place so no intermediate
+    'Unit' objects are made. Entry order matches the 'Unit' operations.
+    """
+    __slots__ = ()
+
+    def __imul__(self, other: _Term) -> _Term:
+        if not isinstance(other, _Term):
+            raise _NotAUnit
+        for k, v in other.items():
+            self[k] = self.get(k, 0) + v
+        return self
+
+    def __itruediv__(self, other: _Term) -> _Term:
+        if not isinstance(other, _Term):
+            raise _NotAUnit
+        for k, v in other.items():
+            self[k] = self.get(k, 0) - v
+        return self
+
+    def __rmul__(self, other):
+        raise _NotAUnit
+
+    __rtruediv__ = __rmul__
+
+    def __pow__(self, power: int | float) -> _Term:
+        return _Term({k: v * power for k, v in self.items()})
+
+    def __add__(self, other):
+        raise UnitDimensionError(f'Units can be added or subtracted.\n{self} + {other}')
+
+    __iadd__ = __add__
+    __radd__ = __add__
+    __isub__ = __add__
+    __rsub__ = __add__
+
+
 class Parser:
-    def __init__(self, expression: str):
+    """
+    Recursive descent parser of unit expressions; works on the tokens from 'tokenize'.
+    With `compiled=True` units are returned as '_Term' dicts (see 'compile_unit').
+    """
+    def __init__(self, expression: str, compiled: bool = False):
         self.expression = expression
-        self.pos = 0
+        self.compiled = compiled
+        self.tokens = []
+        self.pos = 0  # index in tokens
 
     def parse(self) -> int | float | Unit | Quantity:
-        self.syntax_fix()
+        self.tokens = tokenize(self.expression)
         result = self.parse_expression()
-        if self.pos != len(self.expression):
-            raise ValueError('Unexpected character at position ' + str(self.pos))
+        if self.pos != len(self.tokens):
+            raise self.error()
         return result
 
-    def syntax_fix(self):
-        self.expression = self.expression.replace(" per ", "/")
-        self.expression = self.expression.replace("   ", " ")
-        self.expression = self.expression.replace("  ", " ")
-        self.expression = self.expression.replace("**", "^")
-        self.expression = re.sub(r'(?<=[a-zA-Z0-9]) +(?=[a-zA-Z0-9])', "*", self.expression)
-        self.expression = self.expression.replace(" ", "")
-        # self.expression = self.expression.replace("squared", "^2")
-        # self.expression = self.expression.replace("cubed", "^3")
+    def position(self) -> int:
+        """ Position of the current token in the expression. """
+        return self.tokens[self.pos][2] if self.pos < len(self.tokens) else len(self.expression)
+
+    def error(self) -> ValueError:
+        pos = self.position()
+        return ValueError('Unexpected character at position ' + str(pos) +
+                          f"\ntext: {self.expression}\n      {' ' * pos}^")
 
     def parse_expression(self) -> int | float | Unit | Quantity:
         result = self.parse_term()
@@ -118,18 +296,17 @@ class Parser:
             return result
 
         num = self.get_number()
-        if num:
+        if num is not None:
             return num
 
         unit = self.get_unit()
         if unit is not None:
             return unit
 
-        raise ValueError('Unexpected character at position ' + str(self.pos) +
-                         f"\ntext: {self.expression}\n      {' ' * self.pos}^")
+        raise self.error()
 
     def consume(self, char: str):
-        if self.pos < len(self.expression) and self.expression[self.pos] == char:
+        if self.pos < len(self.tokens) and self.tokens[self.pos][0] == char:
             self.pos += 1
             return True
         else:
@@ -137,25 +314,28 @@ class Parser:
 
     def expect(self, char: str):
         if not self.consume(char):
-            raise ValueError('Expected "' + char + '" at position ' + str(self.pos))
+            raise ValueError('Expected "' + char + '" at position ' + str(self.position()))
 
     def get_number(self) -> int | float | None:
-        match = re.match(r'-?\d+(\.\d*)?', self.expression[self.pos:])
-        if match:
-            self.pos += match.end()
-            num = float(match.group(0))
-            if num.is_integer():
-                num = int(num)
-            return num
+        tokens = self.tokens
+        pos = self.pos
+        sign = 1
+        if pos + 1 < len(tokens) and tokens[pos][0] == "-" and tokens[pos + 1][0] == "number":
+            sign = -1  # negative number (e.g. the power in 'cm**-3')
+            pos += 1
+        if pos < len(tokens) and tokens[pos][0] == "number":
+            self.pos = pos + 1
+            return sign * tokens[pos][1]
 
         return None
 
     def get_unit(self) -> Unit | None:
-        match = re.match(r'[a-zA-Z_]+', self.expression[self.pos:])
-        if match:
-            value = self.expression[self.pos:self.pos + match.end()]
-            if value in ledger:
-                self.pos += match.end()
+        if self.pos < len(self.tokens):
+            kind, value, _ = self.tokens[self.pos]
+            if kind == "name" and value in ledger:
+                self.pos += 1
+                if self.compiled:
+                    return _Term({ledger.get_entry(value): 1})
                 return Unit({ledger.get_entry(value): 1})
 
         return None
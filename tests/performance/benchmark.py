@@ -13,6 +13,8 @@ import unitpy
 
 end_import = time.perf_counter()
 
+from unitpy.utils.parsing import Parser, get_value
+
 ZERO_DEPTH_BASES = (str, bytes, int, float, bytearray)
 
 
@@ -157,6 +159,62 @@ def time_math() -> float:
     return run_time / n * 1000  # micro-seconds
 
 
+def _time_parse():
+    # Parser is used directly so the parse cache does not hide the parsing cost
+    data = [
+        Parser("m/s").parse(),
+        Parser("kg*m**2/s**2").parse(),
+        Parser("g/(mol * s)").parse(),
+        Parser("kPa").parse(),
+        Parser("mi/h").parse(),
+    ]
+
+
+def time_parse() -> float:
+    n = 10_000
+    start_time = time.perf_counter()
+    for i in range(n):
+        _time_parse()
+    run_time = time.perf_counter() - start_time
+
+    return run_time / n * 1000  # micro-seconds
+
+
+def print_get_value_scaling():
+    """ Time of splitting the number off quantity strings of increasing length; should grow linearly. """
+    unit = "kilogram meter per second squared "
+    for repeat in (1, 4, 16, 64):
+        text = "1.0 " + unit * repeat
+        n = 10_000
+        start_time = time.perf_counter()
+        for i in range(n):
+            get_value(text)
+        run_time = (time.perf_counter() - start_time) / n * 1_000_000  # us
+        print(f"get_value: {len(text):5d} chars, {run_time:8.3f} us, {run_time / len(text) * 1000:8.3f} ns/char")
+
+
+def print_chain_timing():
+    """ Time of long chained expressions (as in physics models); units cancel along the chain. """
+    rho, v, d, mu = unitpy.Q("998 kg/m**3"), unitpy.Q("2.5 m/s"), unitpy.Q("5 cm"), unitpy.Q("0.89 mPa*s")
+    cp, k, h = unitpy.Q("4.18 kJ/(kg*K)"), unitpy.Q("0.6 W/(m*K)"), unitpy.Q("1500 W/(m**2*K)")
+
+    def chain():
+        reynolds = rho * v * d / mu
+        prandtl = cp * mu / k
+        nusselt = h * d / k
+        result = reynolds * prandtl * nusselt
+        for i in range(10):
+            result = result * rho * v / (rho * v) * cp / cp * k / k
+        return result
+
+    n = 2_000
+    start_time = time.perf_counter()
+    for i in range(n):
+        result = chain()
+    run_time = (time.perf_counter() - start_time) / n * 1_000_000  # us
+    print(f"chained expression: {run_time:8.3f} us, result unit entries {len(result.unit.key)}")
+
+
 def main():
     python_ = sys.version_info
     data = (
@@ -170,6 +228,7 @@ def main():
         ("time define (us)", str(f"{time_defining_quantity():2.5f}")),
         ("time convert (us)", str(f"{time_convert():2.5f}")),
         ("time math (us)", str(f"{time_math():2.5f}")),
+        ("time parse (us)", str(f"{time_parse():2.5f}")),
         ("notes", "")
     )
 
@@ -180,6 +239,26 @@ def main():
         file.write(", ".join(col[1] for col in data))
 
 
+def print_ledger_comparison():
+    """ Build time and memory of the ledger with prefixed units built at import vs. resolved on demand. """
+    import tracemalloc
+    from unitpy.definitions.ledger import build_ledger
+
+    for lazy in (False, True):
+        n = 20
+        start_time = time.perf_counter()
+        for i in range(n):
+            build_ledger(lazy_prefixes=lazy)
+        run_time = (time.perf_counter() - start_time) / n * 1000  # ms
+
+        tracemalloc.start()
+        ledger = build_ledger(lazy_prefixes=lazy)
+        memory = tracemalloc.get_traced_memory()[0] / 1024  # KiB
+        tracemalloc.stop()
+
+        print(f"lazy_prefixes={lazy}: build {run_time:2.3f} ms, memory {memory:8.1f} KiB, entries {len(ledger.units)}")
+
+
 def print_memory_breakdown():
     result = unitpy.Q("1.2 J")
     print("total", total_size(result, verbose=True))
@@ -187,4 +266,7 @@ def print_memory_breakdown():
 
 if __name__ == "__main__":
     main()
+    print_ledger_comparison()
+    print_get_value_scaling()
+    print_chain_timing()
     # print_memory_breakdown()
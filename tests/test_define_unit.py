@@ -71,4 +71,103 @@ def test_unit_prefix():
 def test_unit_prefix2():
     u = unitpy.Unit("kPa")
     assert u.abbr == "kPa"
-    assert u.multiplier == 1000
\ No newline at end of file
+    assert u.multiplier == 1000
+
+
+def test_unit_interned():
+    a = unitpy.Unit("m") / unitpy.Unit("s")
+    b = unitpy.Unit("meter") / unitpy.Unit("second")
+    assert a is b
+    assert a.key == b.key
+
+
+def test_unit_interned_key_differs_from_equality():
+    assert unitpy.Unit("m") == unitpy.Unit("km")
+    assert unitpy.Unit("m").key != unitpy.Unit("km").key
+
+
+def test_unit_pickle():
+    import pickle
+    a = unitpy.Unit("kPa*m**2")
+    assert pickle.loads(pickle.dumps(a)) is a
+
+
+def test_base_set_arithmetic():
+    from unitpy.definitions.unit_base import BaseSet
+
+    a = BaseSet(meter=1, second=-2)
+    b = BaseSet(kilogram=1)
+    assert a * b == BaseSet(meter=1, second=-2, kilogram=1)
+    assert a / b == BaseSet(meter=1, second=-2, kilogram=-1)
+    assert a ** 0.5 == BaseSet(meter=0.5, second=-1)
+    assert (a * b).kilogram == 1
+    assert hash(a * b / b) == hash(a)
+    assert a.exponents == (1, -2, 0, 0, 0, 0, 0)
+
+
+def test_base_set_in_place_operators():
+    from unitpy.definitions.unit_base import BaseSet
+
+    a = BaseSet(meter=1)
+    b = a
+    b *= BaseSet(second=1)
+    assert a == BaseSet(meter=1)
+
+
+def test_base_set_assign():
+    from unitpy.definitions.unit_base import BaseSet
+
+    a = BaseSet(meter=1)
+    b = a ** 1
+    a.meter = 2
+    a.second = -1
+    assert a == BaseSet(meter=2, second=-1) and hash(a) == hash(BaseSet(meter=2, second=-1))
+    assert a.exponents == (2, -1, 0, 0, 0, 0, 0)
+    assert b == BaseSet(meter=1)
+
+
+def test_unit_is_compatible():
+    u = unitpy.Unit("km/h")
+    assert u.is_compatible(unitpy.Unit("m/s"))
+    assert u.is_compatible("mile/hour")
+    assert not u.is_compatible(unitpy.Unit("m"))
+    assert not u.is_compatible(1)
+    assert u.dimension_signature == unitpy.Unit("m/s").dimension_signature
+    assert u.dimension_signature == u.base_unit.dimension_signature
+    assert hash(u.dimension_signature) == hash(unitpy.Unit("m/s").dimension_signature)
+
+
+def test_unit_bytes():
+    for text in ("km/h", "kPa*m**2", "m**0.5", "degC", ""):
+        u = unitpy.Unit(text)
+        assert unitpy.Unit.from_bytes(u.to_bytes()) is u
+    assert len(unitpy.Unit("km/h").to_bytes()) == 18
+    from unitpy.definitions.ledger import ledger
+    u = unitpy.Unit({entry: 1 for entry in ledger.units[:300]})  # more entries than fit in a byte
+    assert len(u.key) == 300 and unitpy.Unit.from_bytes(u.to_bytes()) is u
+    assert unitpy.Unit.from_bytes(bytearray(unitpy.Unit("km/h").to_bytes())) is unitpy.Unit("km/h")
+    assert unitpy.Unit.from_bytes(memoryview(unitpy.Unit("km/h").to_bytes())) is unitpy.Unit("km/h")
+
+    with pytest.raises(ValueError):
+        unitpy.Unit.from_bytes(unitpy.Unit("m").to_bytes()[:-1])
+    with pytest.raises(ValueError):
+        unitpy.Unit.from_bytes(b"\x00\x00\x00\x00\x00\x00\x00\x00")  # other ledger version
+
+
+def test_unit_bytes_after_ledger_change(monkeypatch):
+    from unitpy.definitions.ledger import ledger
+
+    u = unitpy.Unit("km/h")
+    data = u.to_bytes()
+    monkeypatch.setattr(ledger, "_version", ledger.version + 1)  # as after 'ledger.add_unit'
+    assert u.to_bytes() != data
+    assert unitpy.Unit.from_bytes(u.to_bytes()) is u
+
+
+def test_unit_canonical_form():
+    m, s = unitpy.Unit("m"), unitpy.Unit("s")
+    assert m * s is s * m
+    assert unitpy.Unit("m*s") is unitpy.Unit("s*m")
+    assert (m / m).key == () and m / m is unitpy.Unit()
+    assert (m * s / s) is m
+    assert [k.label for k, _ in unitpy.Unit("W*s/kg").key] == ["kilogram", "second", "watt"]
@@ -0,0 +1,43 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import unitpy
+
+IMPORT_TIME_BUDGET = 0.5  # seconds
+
+script = """
+import sys
+import time
+start = time.perf_counter()
+import unitpy
+print(time.perf_counter() - start)
+print("pkg_resources" in sys.modules)
+"""
+
+
+def run_import():
+    # import the same unitpy that is under test
+    env = {**os.environ, "PYTHONPATH": str(pathlib.Path(unitpy.__file__).parents[1])}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env)
+    import_time, pkg_resources_imported = result.stdout.split()
+    return float(import_time), pkg_resources_imported == "True"
+
+
+def test_import_time():
+    results = [run_import() for _ in range(3)]  # best of 3 to not fail on a busy machine
+    assert min(import_time for import_time, _ in results) < IMPORT_TIME_BUDGET
+
+
+def test_import_does_not_load_pkg_resources():
+    _, pkg_resources_imported = run_import()
+    assert not pkg_resources_imported
+
+
+def test_version():
+    assert isinstance(unitpy.__version__, str)
+    with pytest.raises(AttributeError):
+        unitpy.not_an_attribute
@@ -0,0 +1,138 @@
+import pytest
+
+from unitpy.config import CONFIG
+from unitpy.definitions.entry import Entry
+from unitpy.definitions.ledger import Ledger, build_ledger, get_definitions_hash, get_snapshot_path, ledger, \
+    load_ledger, save_snapshot
+from unitpy.definitions.unit_base import BaseSet
+
+
+def test_contains():
+    assert "km" in ledger
+    assert "kilometer" in ledger
+    assert "not_a_unit" not in ledger
+
+
+def test_symbols_frozen_view():
+    symbols = ledger.symbols
+    assert isinstance(symbols, frozenset)
+    assert symbols is ledger.symbols
+    assert "m" in symbols
+
+
+def test_symbols_rebuilt_after_add_unit():
+    ledger_ = Ledger()
+    ledger_.add_unit(Entry(label="meter", abbr="m", base_unit=BaseSet(meter=1), multiplier=1))
+    assert ledger_.symbols == {"meter", "m"}
+
+    ledger_.add_unit(Entry(label="second", abbr="s", base_unit=BaseSet(second=1), multiplier=1))
+    assert ledger_.symbols == {"meter", "m", "second", "s"}
+    assert "s" in ledger_
+
+
+@pytest.fixture(scope="module")
+def ledgers():
+    return build_ledger(lazy_prefixes=False), build_ledger(lazy_prefixes=True)
+
+
+@pytest.mark.parametrize("symbol", ["kPa", "micrometer", "um", "mm", "kg", "ms", "min", "MHz", "mdegC", "kcal"])
+def test_lazy_prefix_matches_eager(ledgers, symbol):
+    eager, lazy = ledgers
+    assert (symbol in eager) == (symbol in lazy)
+    entry_eager = eager.get_entry(symbol)
+    entry_lazy = lazy.get_entry(symbol)
+    assert entry_eager.label == entry_lazy.label
+    assert entry_eager.multiplier == entry_lazy.multiplier
+
+
+def test_lazy_prefix_memoized(ledgers):
+    _, lazy = ledgers
+    assert lazy.get_entry("km") is lazy.get_entry("kilometer")
+    assert len(lazy.units) < len(ledgers[0].units)
+
+
+def test_lazy_prefix_unknown(ledgers):
+    _, lazy = ledgers
+    assert "kkm" not in lazy
+    assert lazy.get_entry("kkm") is None
+
+
+def test_entry_ids(ledgers):
+    eager, lazy = ledgers
+    for ledger_ in (eager, lazy):
+        for symbol in ("m", "kPa", "degC", "mmol"):
+            entry = ledger_.get_entry(symbol)
+            assert ledger_.get_entry_by_id(ledger_.get_entry_id(entry)) is entry
+
+    assert eager.version != lazy.version
+    assert Ledger.from_snapshot(eager.to_snapshot()).version == eager.version
+    with pytest.raises(ValueError):
+        eager.get_entry_by_id(len(eager.units))
+
+
+def test_lazy_entry_ids_independent_of_order():
+    a, b = build_ledger(lazy_prefixes=True), build_ledger(lazy_prefixes=True)
+    a.get_entry("km")
+    id_ = a.get_entry_id(a.get_entry("kPa"))
+    assert id_ == b.get_entry_id(b.get_entry("kPa"))
+    assert b.get_entry_by_id(id_) is b.get_entry("kPa")
+
+
+def test_units_for():
+    from unitpy import Unit
+    from unitpy.definitions.dimensions import Dimension
+
+    joule = ledger.get_entry("J")
+    energy = ledger.units_for("energy")
+    assert joule in energy and ledger.get_entry("cal") in energy
+    assert all(entry.dimensionality == Dimension(length=2, mass=1, time=-2) for entry in energy)
+    assert ledger.units_for(Unit("kg*m**2/s**2")) is energy
+    assert ledger.units_for(Dimension(length=2, mass=1, time=-2)) is energy
+    assert ledger.units_for(joule.base_unit.dimension_signature) is energy
+    assert ledger.units_for(BaseSet(meter=7)) == ()
+    with pytest.raises(ValueError):
+        ledger.units_for("not_a_class")
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache_dir_ = CONFIG.cache_dir
+    CONFIG.cache_dir = tmp_path
+    yield tmp_path
+    CONFIG.cache_dir = cache_dir_
+
+
+def test_snapshot_round_trip(ledgers):
+    eager, _ = ledgers
+    snapshot = Ledger.from_snapshot(eager.to_snapshot())
+    assert snapshot.symbols == eager.symbols
+    for symbol in ("kPa", "min", "degC", "psi"):
+        entry, entry_snapshot = eager.get_entry(symbol), snapshot.get_entry(symbol)
+        assert entry.label == entry_snapshot.label
+        assert entry.multiplier == entry_snapshot.multiplier
+        assert entry.offset == entry_snapshot.offset
+        assert entry.base_unit == entry_snapshot.base_unit
+
+
+def test_load_ledger_writes_and_reads_snapshot(cache_dir):
+    ledger_ = load_ledger()
+    assert not ledger_._cache
+    assert get_snapshot_path(CONFIG.lazy_prefixes).exists()
+
+    ledger_ = load_ledger()
+    assert ledger_._cache
+    assert ledger_.get_entry("kPa").multiplier == 1000
+
+
+def test_load_ledger_rebuilds_stale_snapshot(cache_dir):
+    file = get_snapshot_path(CONFIG.lazy_prefixes)
+    save_snapshot(build_ledger(), file, get_definitions_hash() + 1)
+    assert not load_ledger()._cache
+    assert load_ledger()._cache
+
+
+def test_load_ledger_rebuilds_corrupt_snapshot(cache_dir):
+    file = get_snapshot_path(CONFIG.lazy_prefixes)
+    file.write_bytes(b"not a snapshot")
+    assert "kPa" in load_ledger()
+    assert load_ledger()._cache
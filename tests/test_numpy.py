@@ -150,3 +150,57 @@ def test_np_func_abs():
 def test_np_func_linspace():
     a = np.linspace(1*Unit.mm, 2*Unit.ft, 4)
     assert np.allclose(a.v, np.array([1., 203.86666667, 406.73333333, 609.6]), atol=1E-9)
+
+
+def test_np_converter():
+    converter = Unit.converter("degC", "K")
+    assert np.allclose(converter(np.array([0, 100])), np.array([273.15, 373.15]))
+
+
+def test_np_dispatch_cache():
+    from unitpy.numpy_funcs import _dispatch, HANDLED_UFUNCS, HANDLED_FUNCTIONS
+
+    a = np.linspace(0, 4, 5) * Unit.m
+    assert np.sum(np.isnan(a)) == 0
+    assert np.sum(a) == 10 * Unit.m
+    assert _dispatch[np.isnan] is HANDLED_UFUNCS["isnan"]
+    assert _dispatch[np.sum] is HANDLED_FUNCTIONS["sum"]
+
+    with pytest.raises(NotImplementedError):
+        np.fft.fft(a)
+    assert _dispatch[np.fft.fft] is None
+
+
+def test_np_functions_by_argument():
+    a = np.array([[1., 5.], [3., 7.]]) * Unit.m
+    assert np.all(np.mean(a, 0).v == np.array([2., 6.]))
+    assert np.all(np.mean(a, axis=1).v == np.array([3., 5.]))
+    assert np.all(np.clip(a, 2 * Unit.m, 600 * Unit.cm).v == np.array([[2., 5.], [3., 6.]]))
+    assert np.all(np.clip(a, a_min=None, a_max=6 * Unit.m).v == np.array([[1., 5.], [3., 6.]]))
+    assert np.percentile(a, 50) == 4 * Unit.m
+
+
+def test_np_isclose():
+    a = np.array([1., 2.]) * Unit.m
+    b = np.array([100.1, 210.]) * Unit.cm
+    assert np.all(np.isclose(a, b, atol=0.01) == np.array([True, False]))
+    assert np.allclose(a, b, 0, 0.2)
+    assert not np.allclose(a, b)
+
+
+def test_np_ufunc_out_where():
+    from unitpy.quantity_array import QuantityArray
+
+    a = QuantityArray([1., 2., 3.], "m")
+    where = np.array([True, False, True])
+    out = QuantityArray([7., 7., 7.], "m")
+    np.add(a, a, out=out, where=where)
+    assert np.all(out.value == [2, 7, 6])
+
+    out = QuantityArray([7., 7., 7.], "m")
+    np.maximum(a, a, out=out, where=where)  # no base-value fast path
+    assert np.all(out.value == [1, 7, 3])
+
+    out = QuantityArray([7., 7., 7.], "K")
+    np.add(QuantityArray([1., 2., 3.], "degC"), QuantityArray([1., 1., 1.], "K"), out=out, where=where)
+    assert out.value[1] == 7
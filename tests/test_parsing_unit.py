@@ -1,7 +1,11 @@
+import re
+
 import pytest
 
+from unitpy.config import CONFIG
 from unitpy.definitions.ledger import ledger
-from unitpy.utils.parsing import Parser
+from unitpy.core import Unit
+from unitpy.utils.parsing import Parser, compile_unit, compiled_cache, get_value, parse_unit, unit_cache
 
 
 cases = [
@@ -52,3 +56,102 @@ def test_prefix(case):
     for k in answer:
         assert k in result._unit
         assert answer[k] == result._unit[k]
+
+
+def test_parse_cache_shared_result():
+    unit_cache.clear()
+    a = parse_unit("km/h")
+    b = parse_unit("km/h")
+    assert a is b
+    assert unit_cache.info().hits == 1
+    assert unit_cache.info().misses == 1
+
+
+def test_compile_unit():
+    compiled_cache.clear()
+    compiled = compile_unit("km/h")
+    assert compile_unit("km/h") is compiled
+    assert compiled.entries == ((ledger.get_entry("h"), -1), (ledger.get_entry("km"), 1))  # canonical order
+    assert compiled.multiplier == pytest.approx(1000 / 3600)
+    assert compiled.signature == Unit("m/s").dimension_signature
+    assert Unit._from_compiled(compiled) is parse_unit("km/h")
+    compiled = compile_unit("s*kg*m**2/s**3")
+    unit = Unit._from_compiled(compiled)
+    assert unit.key == compiled.entries and unit.multiplier == compiled.multiplier
+    assert unit is Unit("kg*m**2/s**2")
+    assert compile_unit("degC").offset == 273.15 and compile_unit("degC/min").offset == 0
+    with pytest.raises(ValueError):
+        compile_unit("2*m")
+
+
+@pytest.mark.parametrize("text", ["2 m", "2*m", "1/s", "m/2"])
+def test_compile_unit_not_a_unit(text):
+    with pytest.raises(ValueError, match=f"^Provided string is not a unit: {re.escape(text)}$"):
+        compile_unit(text)
+
+
+def test_parse_cache_in_place_does_not_mutate():
+    a = parse_unit("m")
+    b = a
+    a *= parse_unit("s")
+    assert b.label == "meter"
+    assert parse_unit("m").label == "meter"
+
+
+def test_parse_cache_bounded():
+    size = CONFIG.parse_cache_size
+    try:
+        CONFIG.parse_cache_size = 2
+        unit_cache.clear()
+        for text in ("m", "s", "kg", "K"):
+            parse_unit(text)
+        assert len(unit_cache) == 2
+        assert "K" in unit_cache and "m" not in unit_cache
+    finally:
+        CONFIG.parse_cache_size = size
+
+
+def test_parse_cache_disabled():
+    size = CONFIG.parse_cache_size
+    try:
+        CONFIG.parse_cache_size = 0
+        unit_cache.clear()
+        assert parse_unit("m/s").key == parse_unit("m/s").key
+        assert len(unit_cache) == 0
+        assert unit_cache.info().hits == 0
+    finally:
+        CONFIG.parse_cache_size = size
+
+
+@pytest.mark.parametrize("text, value, rest", [
+    ["1 m", 1, " m"],
+    ["1.5e3 m/s", 1500, " m/s"],
+    ["-2.5E-1kg", -0.25, "kg"],
+    ["+.5 s", 0.5, " s"],
+    ["1_000 Pa", 1000, " Pa"],
+    ["2EJ", 2, "EJ"],
+    ["3 inch", 3, " inch"],
+    ["-inf K", float("-inf"), " K"],
+    ["1.0 kilogram meter per second squared", 1, " kilogram meter per second squared"],
+])
+def test_get_value(text, value, rest):
+    assert get_value(text) == (value, rest)
+
+
+def test_get_value_nan():
+    value, rest = get_value("nan m")
+    assert value != value
+    assert rest == " m"
+    with pytest.raises(ValueError):
+        get_value("m")
+
+
+def test_tokenize():
+    from unitpy.utils.parsing import tokenize
+
+    kinds = [token[0] for token in tokenize("kg m**2 per s^2")]
+    assert kinds == ["name", "*", "name", "^", "number", "/", "name", "^", "number"]
+    assert tokenize("g/(ml*s)")[2] == ("(", None, 2)
+    assert [token[0] for token in tokenize("permittivity")] == ["name"]
+    with pytest.raises(ValueError):
+        tokenize("m$")
@@ -3,6 +3,8 @@ import pickle
 import pytest
 
 from unitpy import Unit, Quantity
+from unitpy.definitions.entry import Entry
+from unitpy.definitions.unit_base import BaseSet
 
 
 def test_pickling():
@@ -10,3 +12,45 @@ def test_pickling():
     dumps = pickle.dumps(q)
     loads = pickle.loads(dumps)
     assert q == loads
+
+
+def test_pickle_keeps_base_value():
+    q = Quantity(0.1, "km/h") * 3
+    loads = pickle.loads(pickle.dumps(q))
+    assert loads._base_value == q._base_value
+    assert loads.unit is q.unit
+
+
+def test_pickle_custom_entry():
+    entry = Entry("smoot", "smoot", BaseSet(meter=1), 1.7018)
+    loads = pickle.loads(pickle.dumps(entry))
+    assert loads is not entry
+    assert (loads.label, loads.base_unit, loads.multiplier) == ("smoot", BaseSet(meter=1), 1.7018)
+
+    q = Quantity(364.4, Unit({entry: 1}) / Unit("s"))
+    loads = pickle.loads(pickle.dumps(q))
+    assert loads._base_value == q._base_value
+    assert loads.unit.label == "smoot/second" and loads.unit.multiplier == q.unit.multiplier
+    assert loads.unit.to_base_value(1) == pytest.approx(1.7018)
+
+    km = Unit("km")
+    assert pickle.loads(pickle.dumps(km)) is km  # ledger entries still unpickle to the ledger's entry
+
+
+def test_unpickle_old_state():
+    q = Quantity.__new__(Quantity)
+    q.__setstate__("123.2 centimeter")
+    assert q == 123.2 * Unit.cm
+    q.__setstate__((1.232, "cm"))
+    assert q == 123.2 * Unit.cm
+
+
+def test_pickle_out_of_band():
+    np = pytest.importorskip("numpy")
+    a = Quantity(np.arange(5.), "km")
+    buffers = []
+    dumps = pickle.dumps(a, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    loads = pickle.loads(dumps, buffers=buffers)
+    assert type(loads) is type(a) and loads.unit is a.unit
+    assert np.shares_memory(loads.base_value, np.asarray(buffers[0]))
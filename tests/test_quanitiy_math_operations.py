@@ -174,3 +174,49 @@ def test_isclose_abs():
     q2 = Q("1.0 in")
     assert q.is_close(q2, abs_tol=0.1 * U.inch)
     assert not q.is_close(q2, abs_tol=0.001 * U.inch)
+
+
+def test_inplace_mul_by_quantity():
+    q = 1 * U.m
+    q *= 1 * U.km
+    assert q.unit.label == (U.m * U.km).label
+    assert q == 1000 * U.m ** 2
+
+
+def test_to_keeps_base_value():
+    q = Q("1.5 km")
+    assert q.to("m").base_value == q.base_value
+    assert q.to("m").v == 1500
+
+
+def test_simplify():
+    q = Q("2 kg") * Q("3 m**2") / Q("1 s**2")
+    assert q.simplify().unit.label == "joule"
+    assert q.simplify().v == 6
+    assert (Q("1 kg") * Q("1 km**2") / Q("1 s**2")).simplify().v == 1_000_000
+    assert (Q("1 m") / Q("1 km")).simplify().unit.label == "meter/kilometer"  # lengths cancel
+    assert (Q("1 km") / (Q("1 m") * Q("1 s"))).simplify().unit.label == "kilometer/(meter second)"
+    assert (Q("3 rad") / Q("1 s")).simplify().unit.label == "radian/second"  # not 'hertz'
+    assert (Q("3 N") * Q("1 m")).simplify().unit.label == "meter newton"  # may be a torque, not 'joule'
+    assert (Q("2 m") / Q("1 s")).simplify().unit.label == "meter/second"  # no preferred unit
+    assert (Q("3 m/s") ** 2).simplify().unit.label == "meter**2/second**2"  # not 'gray'
+    assert (Q("1 mol") / Q("1 s")).simplify().unit.label == "mole/second"  # not 'katal'
+    assert (1 / Q("2 s")).simplify().unit.label == "second**-1"  # not compound
+    assert Q("1 km").simplify().unit.label == "kilometer"  # not compound
+    assert U("kg*m/s**2").simplify() is U("N")
+
+
+def test_simplify_config():
+    from unitpy import CONFIG
+
+    assert (Q("2 kg") * Q("3 m/s**2")).unit.label != "newton"
+    CONFIG.simplify_units = True
+    try:
+        assert (Q("2 kg") * Q("3 m/s**2")).unit.label == "newton"
+        assert (Q("1 kg*m**2") / Q("1 s**3")).unit.label == "watt"
+        assert Q("3 rad/s").unit.label == "radian/second"
+        assert (Q("3 rad") / Q("1 s")).unit.label == "radian/second"
+        assert (Q("1 N") * Q("1 m")).unit.label == "meter newton"
+        assert (1 / Q("2 s")).unit.label == "second**-1"
+    finally:
+        CONFIG.simplify_units = False
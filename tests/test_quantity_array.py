@@ -0,0 +1,163 @@
+import copy
+import pickle
+
+import pytest
+
+import numpy as np
+
+import unitpy
+from unitpy import Unit, Quantity
+from unitpy.quantity_array import QuantityArray
+from unitpy.errors import UnitDimensionError
+
+
+def test_creation():
+    a = np.linspace(0, 4, 5) * Unit.km
+    assert isinstance(a, QuantityArray)
+    assert isinstance(Quantity(np.ones(3), "m"), QuantityArray)
+    assert isinstance(QuantityArray([1, 2, 3], "m"), QuantityArray)
+    assert unitpy.QuantityArray is QuantityArray
+    assert np.all(a.value == np.linspace(0, 4, 5))
+    assert np.all(a.base_value == np.linspace(0, 4000, 5))
+    assert a.shape == (5,) and a.ndim == 1 and a.size == 5 and len(a) == 5
+
+
+def test_creation_from_sequences():
+    for unit in ("m", "km", "degC"):  # same result whatever the multiplier or offset
+        a = Quantity([1, 2], unit)
+        assert isinstance(a, QuantityArray) and isinstance(a.base_value, np.ndarray)
+        assert np.allclose(a.value, [1, 2])
+    assert np.all(Quantity((1, 2), "km").base_value == [1000, 2000])
+    assert Quantity([[1, 2], [3, 4]], "m").shape == (2, 2)
+
+
+def test_scalars_stay_quantity():
+    assert type(Quantity(1, "m")) is Quantity
+    assert type(np.float64(1.5) * Unit.m) is Quantity
+
+
+def test_to():
+    a = QuantityArray([1, 2, 3], "km")
+    b = a.to("m")
+    assert isinstance(b, QuantityArray)
+    assert b.unit == Unit.m
+    assert np.allclose(b.value, [1000, 2000, 3000])
+    assert not np.shares_memory(a.base_value, b.base_value)
+
+    t = QuantityArray([0, 100], "degC").to("K")
+    assert np.allclose(t.value, [273.15, 373.15])
+
+    with pytest.raises(UnitDimensionError):
+        a.to("s")
+
+
+def test_slicing_shares_memory():
+    a = QuantityArray(np.arange(6.), "m")
+    b = a[1:4]
+    assert isinstance(b, QuantityArray)
+    assert np.shares_memory(a.base_value, b.base_value)
+    b += 1 * Unit.m
+    assert np.all(a.value == [0, 2, 3, 4, 4, 5])
+
+    a[0] = 1 * Unit.km
+    assert a[0] == 1 * Unit.km
+    assert type(a[0]) is Quantity
+    with pytest.raises(UnitDimensionError):
+        a[0] = 1 * Unit.s
+
+
+def test_array_zero_copy():
+    a = QuantityArray(np.arange(3.), "m")
+    assert np.asarray(a) is a.base_value
+    assert np.shares_memory(np.asarray(a), a.base_value)
+    assert not np.shares_memory(np.array(a, copy=True), a.base_value)
+    assert np.allclose(np.asarray(QuantityArray([1, 2], "km")), [1, 2])
+
+
+def test_arithmetic():
+    a = QuantityArray([1, 2], "km")
+    b = QuantityArray([500, 500], "m")
+    assert np.allclose((a + b).value, [1.5, 2.5])
+    assert np.allclose((a - b).value, [0.5, 1.5])
+    assert np.allclose((1 * Unit.km + a).value, [2, 3])
+    assert np.all(a.is_close(QuantityArray([1000, 2000.0000001], "m")))
+
+
+def test_iter_and_copy():
+    a = QuantityArray([1, 2], "m")
+    assert [q.value for q in a] == [1, 2]
+    b = copy.copy(a)
+    assert np.all(b.value == a.value)
+    assert not np.shares_memory(a.base_value, b.base_value)
+    with pytest.raises(TypeError):
+        hash(a)
+
+
+def test_pickle():
+    a = QuantityArray([1, 2], "km/h")
+    b = pickle.loads(pickle.dumps(a))
+    assert isinstance(b, QuantityArray)
+    assert b.unit is a.unit
+    assert np.all(b.base_value == a.base_value)
+
+
+def test_ufunc_out():
+    a = QuantityArray(np.arange(3.), "m")
+    b = QuantityArray(np.ones(3), "km")
+    base = a.base_value
+    assert np.add(a, b, out=a) is a
+    assert a.base_value is base
+    assert np.all(a.value == [1000, 1001, 1002])
+
+    np.multiply(a, 2, out=(a,))
+    assert np.all(a.value == [2000, 2002, 2004])
+
+    c = QuantityArray(np.zeros(3), "km*s")
+    np.multiply(a, 1 * Unit.s, out=c)
+    assert np.allclose(c.value, [2, 2.002, 2.004])
+
+    d = QuantityArray(np.zeros(3), "m")
+    np.maximum(a, b, out=d)  # no base-value fast path
+    assert np.all(d.value == [2000, 2002, 2004])
+
+
+def test_ufunc_out_errors():
+    a = QuantityArray(np.arange(3.), "m")
+    with pytest.raises(UnitDimensionError):
+        np.add(a, 1 * Unit.s, out=a)
+    with pytest.raises(UnitDimensionError):
+        np.multiply(a, a, out=a)
+    with pytest.raises(TypeError):
+        np.add(a, a, out=np.zeros(3))
+
+
+def test_from_strings():
+    from unitpy.utils.parsing import parse_quantities, unit_cache
+
+    unit_cache.clear()
+    a = parse_quantities(["12.3 psi", "1 kPa", "1_000 Pa", "-inf psi", ".5e1 psi", "2*psi"])
+    assert isinstance(a, QuantityArray)
+    assert a.unit == Unit("psi")
+    assert np.allclose(a.to("kPa").value, [84.8054, 1, 1, -np.inf, 34.4738, 13.7895], rtol=1e-5)
+    assert unit_cache.info().misses == 3  # one parse per distinct unit string
+
+    b = QuantityArray.from_strings(np.array([["1 m", "2 m"], ["3 km", "4m"]]))
+    assert b.shape == (2, 2)
+    assert np.all(b.value == [[1, 2], [3000, 4]])
+
+
+def test_from_strings_errors():
+    with pytest.raises(UnitDimensionError):
+        QuantityArray.from_strings(["1 m", "1 s"])
+    with pytest.raises(ValueError):
+        QuantityArray.from_strings(["m"])
+
+
+def test_ufunc_out_offset_units():
+    t = QuantityArray([0., 100.], "degC")
+    t2 = QuantityArray([10., 10.], "degC")
+    for ufunc, args in ((np.subtract, (t, t2)), (np.add, (t, t))):
+        expected = ufunc(*args)
+        out = QuantityArray(np.zeros(2), "K")
+        assert ufunc(*args, out=out) is out
+        assert np.allclose(out.base_value, expected.base_value)
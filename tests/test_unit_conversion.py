@@ -1,7 +1,11 @@
+import math
 
 import pytest
 
 import unitpy
+from unitpy.config import CONFIG
+from unitpy.core import conversion_cache, get_conversion_factors
+from unitpy.definitions.ledger import ledger
 
 cases = (
     # length
@@ -47,3 +51,81 @@ def test_equal(case):
     q1 = unitpy.Q(case[0])
     q2 = unitpy.Q(case[1])
     assert q1.is_close(q2, rel_tol=1e-5)
+
+
+@pytest.mark.parametrize("case", cases)
+def test_converter(case):
+    q1 = unitpy.Q(case[0])
+    q2 = unitpy.Q(case[1])
+    converter = unitpy.U.converter(q1.unit, q2.unit)
+    assert math.isclose(converter(q1.v), q2.v, rel_tol=1e-5, abs_tol=1e-9)
+
+
+def test_converter_sequences():
+    converter = unitpy.U.converter("degC", "degF")
+    assert [round(v, 9) for v in converter([0, 100])] == [32, 212]
+    assert [round(v, 9) for v in converter((0, 100))] == [32, 212]
+
+
+def test_converter_cached():
+    assert unitpy.U.converter("km/h", "m/s") is unitpy.U.converter("km/h", "m/s")
+    assert unitpy.U.converter("km/h", "m/s") is not unitpy.U.converter("m/s", "km/h")
+
+
+def test_converter_incompatible():
+    with pytest.raises(unitpy.errors.UnitDimensionError):
+        unitpy.U.converter("m", "s")
+
+
+def test_conversion_reuses_unit_multiplier():
+    km = unitpy.Unit("km")
+    assert get_conversion_factors(km, unitpy.Unit("m")) == (1000, 0)
+    unit = unitpy.Unit({ledger.get_entry("km"): 1})  # built separately, same unit expression
+    assert unit is km and unit._multiplier is not None  # interned, so the multiplier isn't recomputed
+
+    q = unitpy.Q("1 km") + unitpy.Q("500 m")  # add/sub/to work on base values; no conversion factors needed
+    assert q.to("m").v == 1500
+
+
+def test_conversion_cache():
+    conversion_cache.clear()
+    assert get_conversion_factors(unitpy.Unit("km"), unitpy.Unit("m")) == (1000, 0)
+    assert get_conversion_factors(unitpy.Unit("km"), unitpy.Unit("m")) == (1000, 0)
+    assert conversion_cache.info().hits == 1 and conversion_cache.info().misses == 1
+
+    size = CONFIG.conversion_cache_size
+    try:
+        CONFIG.conversion_cache_size = 2
+        for dst in ("m", "cm", "mm"):
+            get_conversion_factors(unitpy.Unit("km"), unitpy.Unit(dst))
+        assert len(conversion_cache) == 2
+    finally:
+        CONFIG.conversion_cache_size = size
+
+
+def test_conversion_incompatible():
+    with pytest.raises(unitpy.errors.UnitDimensionError):
+        unitpy.Q("1 km").to("s")
+
+
+def test_offset_only_for_lone_affine_unit():
+    assert unitpy.U("degC").offset == 273.15
+    assert unitpy.U("degC/min").offset == 0
+    assert unitpy.U("J/degF").offset == 0
+    assert unitpy.U("degC**2").offset == 0
+    assert math.isclose(unitpy.Q("10 degC/min").to("K/s").v, 1 / 6)
+
+
+def test_base_value_kernels_out():
+    np = pytest.importorskip("numpy")
+    unit = unitpy.U("degF")
+    values = np.array([32., 212., -40.])
+    out = np.empty(3)
+    assert unit.to_base_value(values, out=out) is out
+    assert np.allclose(out, [273.15, 373.15, 233.15])
+    assert unit.from_base_value(out, out=out) is out
+    assert np.allclose(out, values)
+
+    convert = unitpy.U.converter("degF", "degC")
+    assert convert(values, out=values) is values
+    assert np.allclose(values, [0, 100, -40])